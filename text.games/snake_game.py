@@ -8,9 +8,13 @@ import time
 import random
 import sys
 import math
+from collections import deque
 from enum import Enum
+from itertools import accumulate, chain, islice
+from operator import attrgetter, itemgetter
 from dataclasses import dataclass
-from typing import List, Tuple, Set, Dict, Optional, Any
+from functools import lru_cache
+from typing import List, Tuple, Set, Dict, Optional, Any, NamedTuple
 
 # =============================================================================
 # CONFIGURATION
@@ -53,6 +57,8 @@ class Config:
     AI_UPDATE_INTERVAL = 0.02  # More frequent AI updates for more responsive behavior
     EMERGENCY_WALL_CHECK = True  # Always check for walls even between update intervals
     LOOK_AHEAD_STEPS = 8  # Increased look ahead for smarter AI behavior
+    MIN_LOOK_AHEAD_STEPS = 3  # Look ahead used once the tick's AI time budget is spent
+    AI_TICK_BUDGET = 0.05  # Seconds of AI thinking per tick before snakes fall back to the short look ahead
     OPEN_SPACE_WEIGHT = 2.2  # Reduced space weight to make AIs more willing to enter confined areas
     SURVIVAL_THRESHOLD = 6  # Lower space threshold for survival mode - more aggressive
     TUNNEL_CHECK_ENABLED = True  # Check tunnels for safety
@@ -72,6 +78,22 @@ class Config:
     DEBUG_INTEGRITY = True  # Enable body integrity checks to prevent invisible collision bugs
 
 
+# Occupancy grid cell flags (see GameState.grid)
+CELL_OBSTACLE = 1   # Snake body or other blocking position
+CELL_DANGER = 2     # Next to a head of an equal or bigger snake (not blocking)
+CELL_WALL = 4       # Board border, stamped permanently
+CELL_PATH = 8       # Scratch: cells occupied by the simulated snake in look_ahead
+CELL_TUNNEL = 16    # Scratch: cells followed by check_tunnel_safety
+CELL_VISITED = 32   # Scratch: cells reached by the free_space floodfill
+CELL_FOOD = 64      # Food item (not blocking)
+CELL_POWER_UP = 128 # Power-up (not blocking)
+CELL_BLOCKED = CELL_OBSTACLE | CELL_WALL | CELL_PATH | CELL_TUNNEL
+
+# bytes.translate() table mapping obstacle cells to 1 and everything else to 0,
+# so a grid slice can be counted with .count(1) instead of a Python loop
+OBSTACLE_BITS = bytes(flags & CELL_OBSTACLE for flags in range(256))
+
+
 # =============================================================================
 # ENUMS & DATA CLASSES
 # =============================================================================
@@ -86,7 +108,7 @@ class Direction(Enum):
     @staticmethod
     def is_opposite(dir1, dir2):
         """Check if two directions are opposite"""
-        return dir1.value[0] == -dir2.value[0] and dir1.value[1] == -dir2.value[1]
+        return OPPOSITE_DIRECTION[dir1] is dir2
     
     @staticmethod
     def from_key(key):
@@ -105,7 +127,19 @@ class Direction(Enum):
     @staticmethod
     def all_directions():
         """Return all four directions"""
-        return [Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT]
+        return ALL_DIRECTIONS
+
+
+# Direction lookups resolved once at import; Enum .value access is slow in AI loops
+ALL_DIRECTIONS = (Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT)
+OPPOSITE_DIRECTION = {
+    Direction.UP: Direction.DOWN,
+    Direction.DOWN: Direction.UP,
+    Direction.LEFT: Direction.RIGHT,
+    Direction.RIGHT: Direction.LEFT,
+}
+DIRECTION_OFFSETS = tuple(d.value for d in ALL_DIRECTIONS)  # (dx, dy) in ALL_DIRECTIONS order
+DIRECTION_DELTAS = tuple((d, dx, dy, OPPOSITE_DIRECTION[d]) for d, (dx, dy) in zip(ALL_DIRECTIONS, DIRECTION_OFFSETS))
 
 
 class FoodType(Enum):
@@ -149,7 +183,7 @@ class PowerUpType(Enum):
     MIMIC = 30            # Copies the power-up effect of the nearest snake
 
 
-@dataclass
+@dataclass(slots=True)
 class Food:
     """Food object representing something snakes can eat"""
     position: Tuple[int, int]
@@ -164,7 +198,7 @@ class Food:
         return self.position == other.position
 
 
-@dataclass
+@dataclass(slots=True)
 class PowerUp:
     """Power-up object with special effects"""
     position: Tuple[int, int]
@@ -340,6 +374,40 @@ class AIStrategy(Enum):
     ENFORCER = 24        # Attempts to eliminate the leading snake
 
 
+# Strategies that switch to survival scoring when space runs low, and the ones that
+# keep charging unless almost boxed in (see Snake.choose_direction)
+SURVIVAL_STRATEGIES = frozenset({AIStrategy.CAUTIOUS, AIStrategy.DEFENSIVE, AIStrategy.SCAVENGER, AIStrategy.TERRITORIAL})
+RECKLESS_STRATEGIES = frozenset({AIStrategy.BERSERKER, AIStrategy.KAMIKAZE})
+
+# Strategy groups used when handing out strategies to new AI snakes (see GameState.create_snakes)
+AGGRESSIVE_STRATEGIES = (
+    AIStrategy.AGGRESSIVE,
+    AIStrategy.HUNTER,
+    AIStrategy.BERSERKER,
+    AIStrategy.KAMIKAZE,
+    AIStrategy.INTERCEPTOR
+)
+TACTICAL_STRATEGIES = (
+    AIStrategy.OPPORTUNISTIC,
+    AIStrategy.TERRITORIAL,
+    AIStrategy.TRAP_SETTER,
+    AIStrategy.STALKER
+)
+DEFENSIVE_STRATEGIES = (
+    AIStrategy.CAUTIOUS,
+    AIStrategy.DEFENSIVE,
+    AIStrategy.SCAVENGER,
+    AIStrategy.POWERUP_SEEKER
+)
+
+# Weighted strategy pool to favor more aggressive behavior
+WEIGHTED_STRATEGIES = (
+    AGGRESSIVE_STRATEGIES * 5 +  # 5x weight for aggressive
+    TACTICAL_STRATEGIES * 3 +    # 3x weight for tactical
+    DEFENSIVE_STRATEGIES * 1     # 1x weight for defensive
+)
+
+
 # =============================================================================
 # OBSTACLE CLASS
 # =============================================================================
@@ -352,7 +420,7 @@ class ObstacleType(Enum):
     SWAMP = 4       # Slows down snakes passing through
     ENERGY_FIELD = 5 # Speeds up snakes passing through
 
-@dataclass
+@dataclass(slots=True)
 class Obstacle:
     """Obstacle object that affects snake movement"""
     position: Tuple[int, int]
@@ -364,6 +432,7 @@ class Obstacle:
     def __init__(self, position, type=None):
         self.position = position
         self.type = type or random.choice([t for t in ObstacleType if t != ObstacleType.WORMHOLE])
+        self.linked_position = None  # Set by create_obstacles when wormholes are paired
         
         # Set appearance based on type
         if self.type == ObstacleType.WALL:
@@ -405,11 +474,38 @@ class Obstacle:
 # SNAKE CLASS
 # =============================================================================
 
+class ScoreContext(NamedTuple):
+    """Per-candidate inputs handed to the strategy scorers in choose_direction"""
+    new_head: Tuple[int, int]
+    head: Tuple[int, int]
+    target: Tuple[int, int]
+    target_score: float
+    space: int
+    space_score: float
+    danger_score: float
+    look_ahead_score: float
+    manhattan_to_target: int
+    foods: List[Any]
+    target_is_dropped: bool  # Target is dropped food from a dead snake
+    target_power_up_type: Optional[Any]  # PowerUpType at the target, None if it is food
+    other_snakes_positions: List[Tuple[int, int]]
+    enemies: List[Tuple[int, int, int]]  # (head x, head y, length) of other living snakes
+    largest_enemy: Optional[Any]  # Longest other living snake, None if there is none
+    shared: Dict[str, Any]  # Per-decision scratch space for work reused across candidates
+    game_state: Any
+
+
 class Snake:
     """Snake class representing a player or AI-controlled snake"""
     
+    __slots__ = (
+        "body", "body_set", "direction", "prev_direction", "id", "is_human",
+        "strategy", "alive", "score", "death_order", "current_target",
+        "last_ai_update", "power_ups", "consecutive_moves", "territory_center",
+    )
+    
     def __init__(self, body, direction, id, strategy=None, is_human=False):
-        self.body = list(body)  # List of (x, y) coordinates, head is first
+        self.body = deque(body)  # (x, y) coordinates, head is first
         self.body_set = set(body)  # Set for faster collision checks
         self.direction = direction
         self.prev_direction = direction
@@ -484,15 +580,17 @@ class Snake:
         
         return True
     
+    def _next_head_xy(self, new_dir=None):
+        """Calculate the next head position as two scalars (no tuple allocation)"""
+        dx, dy = (new_dir or self.direction).value
+        head = self.body[0]
+        return head[0] + dx, head[1] + dy
+    
     def next_head(self, new_dir=None):
         """Calculate the position of the next head"""
         if not self.body:  # Check if body is empty
             return None
-        if new_dir is None:
-            new_dir = self.direction
-        head = self.body[0]
-        dx, dy = new_dir.value
-        return (head[0] + dx, head[1] + dy)
+        return self._next_head_xy(new_dir)
     
     def move(self, foods, other_snakes_positions, power_ups, game_state):
         """Move the snake by updating its direction and position.
@@ -510,39 +608,39 @@ class Snake:
         # Update direction for AI snakes
         if not self.is_human:
             current_time = time.time()
+            grid = None  # Stamped at most once per move and shared with choose_direction
             
             # Check if we're about to hit a wall
-            next_head = self.next_head()
-            if next_head is None:
-                return None
-            x, y = next_head
+            x, y = self._next_head_xy()
             
             # Emergency wall avoidance - always check this regardless of AI update interval
+            # (the next head never equals the current one, so body_set stands in for body[1:])
             if Config.EMERGENCY_WALL_CHECK and (
                 x <= 0 or x >= game_state.width - 1 or y <= 0 or y >= game_state.height - 1 or
-                next_head in other_snakes_positions or next_head in self.body[1:]):
+                (x, y) in other_snakes_positions or (x, y) in self.body_set):
                 # About to hit something, find a safe direction immediately
                 safe_directions = []
+                grid = game_state.stamp_grid(other_snakes_positions, islice(self.body, 1, None),
+                                             foods=foods, power_ups=power_ups)
                 
                 # First, evaluate each direction thoroughly
                 direction_scores = []
-                for direction in Direction.all_directions():
-                    if Direction.is_opposite(direction, self.direction):
+                opposite = OPPOSITE_DIRECTION[self.direction]
+                hx, hy = self.body[0]
+                for direction, dx, dy, _ in DIRECTION_DELTAS:
+                    if direction is opposite:
                         continue
                     
-                    test_pos = (self.body[0][0] + direction.value[0], self.body[0][1] + direction.value[1])
-                    if not self.is_safe(test_pos, other_snakes_positions | set(self.body[1:]), game_state):
+                    test_pos = (hx + dx, hy + dy)
+                    if not self.is_safe(test_pos, grid, game_state):
                         continue
                     
                     # Calculate free space score to find the best escape route
-                    space_score = self.free_space(test_pos, other_snakes_positions | set(self.body[1:]),
-                                                foods, power_ups, game_state)
+                    space_score = self.free_space(test_pos, grid, game_state)
                     
                     # Check if this direction might lead to a tunnel/trap
                     if Config.TUNNEL_CHECK_ENABLED:
-                        is_tunnel_safe = self.check_tunnel_safety(
-                            self.body[0], direction, other_snakes_positions | set(self.body[1:]), 
-                            set(), game_state)
+                        is_tunnel_safe = self.check_tunnel_safety(self.body[0], direction, grid, game_state)
                         
                         if not is_tunnel_safe:
                             space_score -= 300  # Penalize tunnels, but don't remove them completely
@@ -552,7 +650,7 @@ class Snake:
                 
                 # If we found safe directions, choose the one with the most space
                 if direction_scores:
-                    best_direction = max(direction_scores, key=lambda x: x[1])[0]
+                    best_direction = max(direction_scores, key=itemgetter(1))[0]
                     self.direction = best_direction
                 elif safe_directions:
                     # Fallback to any safe direction if scoring failed
@@ -560,7 +658,7 @@ class Snake:
                     
             # Regular AI update on the normal interval
             if current_time - self.last_ai_update > Config.AI_UPDATE_INTERVAL:
-                self.choose_direction(foods, other_snakes_positions, power_ups, game_state)
+                self.choose_direction(foods, other_snakes_positions, power_ups, game_state, grid)
                 self.last_ai_update = current_time
         
         # Calculate the intended next head position
@@ -571,43 +669,39 @@ class Snake:
         
         # Check if this position has an obstacle that might teleport us
         final_head = intended_head
-        for obstacle in game_state.obstacles:
-            if intended_head == obstacle.position:
-                effect = obstacle.get_effect()
-                if "teleport" in effect and effect["teleport"]:
-                    teleport_dest = effect["teleport"]
-                    
-                    # Verify the teleport destination is safe
-                    # Check bounds
-                    if not (0 < teleport_dest[0] < game_state.width - 1 and 
-                            0 < teleport_dest[1] < game_state.height - 1):
-                        # Destination out of bounds, don't teleport - snake will die
-                        break
-                    
-                    # Check if destination has another snake
-                    destination_blocked = teleport_dest in other_snakes_positions
-                    
-                    # Check if destination has a deadly obstacle
-                    if not destination_blocked:
-                        for other_obstacle in game_state.obstacles:
-                            if other_obstacle.position == teleport_dest:
-                                other_effect = other_obstacle.get_effect()
-                                if other_effect.get("deadly", False):
-                                    destination_blocked = True
-                                    break
-                    
-                    # Only use teleport destination if it's safe
-                    if not destination_blocked:
-                        final_head = teleport_dest
-                    # Otherwise, snake enters wormhole and dies (final_head stays as wormhole position)
+        for obstacle in game_state.obstacles_at.get(intended_head, ()):
+            effect = obstacle.get_effect()
+            if "teleport" in effect and effect["teleport"]:
+                teleport_dest = effect["teleport"]
+                
+                # Verify the teleport destination is safe
+                # Check bounds
+                if not (0 < teleport_dest[0] < game_state.width - 1 and 
+                        0 < teleport_dest[1] < game_state.height - 1):
+                    # Destination out of bounds, don't teleport - snake will die
                     break
+                
+                # Check if destination has another snake
+                destination_blocked = teleport_dest in other_snakes_positions
+                
+                # Check if destination has a deadly obstacle
+                if not destination_blocked:
+                    for other_obstacle in game_state.obstacles_at.get(teleport_dest, ()):
+                        if other_obstacle.get_effect().get("deadly", False):
+                            destination_blocked = True
+                            break
+                
+                # Only use teleport destination if it's safe
+                if not destination_blocked:
+                    final_head = teleport_dest
+                # Otherwise, snake enters wormhole and dies (final_head stays as wormhole position)
+                break
         
-        # Now build the new body with the final head position
+        # Now add the final head position to the body
         # This is the ONLY place where the head is added
-        new_body = [final_head] + self.body
+        self.body.appendleft(final_head)
         
         # Rebuild body_set from the new body to guarantee synchronization
-        self.body = new_body
         self._rebuild_body_set()
         
         # Validate integrity in debug mode
@@ -811,42 +905,42 @@ class Snake:
                 # Update food position
                 food.position = (food.position[0] + dx, food.position[1] + dy)
     
-    def free_space(self, pos, obstacles, foods, power_ups, game_state):
+    def free_space(self, pos, grid, game_state):
         """Calculate free space around a position (floodfill algorithm with optimized performance)"""
-        # Quick boundary check first
+        # Quick boundary check first: off the board or on a wall cell
         x, y = pos
-        if x <= 0 or x >= game_state.width - 1 or y <= 0 or y >= game_state.height - 1:
+        width = game_state.width
+        if not (0 <= x < width and 0 <= y < game_state.height) or grid[y * width + x] & CELL_WALL:
             return 0  # No free space if it's on a boundary
         
+        # From here on every position looked at is on the board, so the wall
+        # cells of the grid stand in for explicit bounds checks
+        
         # Use a faster, less comprehensive calculation for large games
         if Config.OPTIMIZE_FOR_LARGE_GAMES and len(game_state.snakes) >= Config.LARGE_GAME_THRESHOLD:
             # Check immediate and diagonal neighbors for large games
+            pos_idx = y * width + x
             free_neighbors = 0
             exit_paths = 0
             for dx, dy in [(0,1), (1,0), (0,-1), (-1,0), (1,1), (1,-1), (-1,1), (-1,-1)]:
-                nx, ny = x + dx, y + dy
-                if (nx <= 0 or nx >= game_state.width - 1 or 
-                    ny <= 0 or ny >= game_state.height - 1):
+                n_idx = (y + dy) * width + x + dx
+                if grid[n_idx] & CELL_BLOCKED:
                     continue
-                if (nx, ny) not in obstacles:
-                    free_neighbors += 1
-                    # Check for exit paths - spaces that lead to even more space
-                    has_further_space = False
-                    for nx2, ny2 in [(nx+1, ny), (nx-1, ny), (nx, ny+1), (nx, ny-1)]:
-                        if (nx2 <= 0 or nx2 >= game_state.width - 1 or 
-                            ny2 <= 0 or ny2 >= game_state.height - 1):
-                            continue
-                        if (nx2, ny2) not in obstacles and (nx2, ny2) != pos:
-                            has_further_space = True
-                            break
-                    if has_further_space:
+                free_neighbors += 1
+                # Check for exit paths - spaces that lead to even more space
+                for n2_idx in (n_idx + 1, n_idx - 1, n_idx + width, n_idx - width):
+                    if not grid[n2_idx] & CELL_BLOCKED and n2_idx != pos_idx:
                         exit_paths += 1
+                        break
             
             # Quick estimate based on free neighbors and exit paths
             return free_neighbors * 15 + exit_paths * 10
         
         # Full floodfill algorithm for smaller games
-        visited = set()
+        # Visited cells are marked in the grid with CELL_VISITED (cleared again before
+        # returning) instead of hashing them into a set; to_visit keeps its tuples so
+        # the fill order stays the same
+        visited = []
         to_visit = {pos}
         count = 0
         found_food = False
@@ -856,55 +950,55 @@ class Snake:
         # Increase the search limit for better path finding
         search_limit = 150  # Higher search limit
         
-        while to_visit and count < search_limit:
-            p = to_visit.pop()
-            if p in visited or p in obstacles:
-                continue
-            
-            visited.add(p)
-            x, y = p
-            
-            # Check board boundaries
-            if x <= 0 or x >= game_state.width - 1 or y <= 0 or y >= game_state.height - 1:
-                continue
-            
-            # Check if we found a potential exit route (near edge of search space)
-            if count > 30:
-                # Check if this point has neighbors outside our visited area
-                # which would suggest it leads to more open space
-                neighbors_outside = 0
-                for direction in Direction.all_directions():
-                    dx, dy = direction.value
-                    neighbor = (x + dx, y + dy)
-                    if neighbor not in visited and neighbor not in obstacles:
-                        nx, ny = neighbor
-                        if not (nx <= 0 or nx >= game_state.width - 1 or 
-                                ny <= 0 or ny >= game_state.height - 1):
+        try:
+            while to_visit and count < search_limit:
+                p = to_visit.pop()
+                x, y = p
+                idx = y * width + x
+                cell = grid[idx]
+                if cell & (CELL_OBSTACLE | CELL_VISITED):
+                    continue
+                
+                grid[idx] = cell | CELL_VISITED
+                visited.append(idx)
+                
+                # Check board boundaries
+                if cell & CELL_WALL:
+                    continue
+                
+                # Check if we found a potential exit route (near edge of search space)
+                if count > 30:
+                    # Check if this point has neighbors outside our visited area
+                    # which would suggest it leads to more open space
+                    neighbors_outside = 0
+                    for n_idx in (idx - width, idx + width, idx - 1, idx + 1):
+                        if not grid[n_idx] & (CELL_BLOCKED | CELL_VISITED):
                             neighbors_outside += 1
+                    
+                    if neighbors_outside >= 2:
+                        exit_routes += 1
+                
+                # Check if food is found
+                if cell & CELL_FOOD:
+                    found_food = True
+                    if count > 20 and exit_routes > 0:  # Exit if we found food and have exit routes
+                        return count + 100 + exit_routes * 30
                 
-                if neighbors_outside >= 2:
-                    exit_routes += 1
-            
-            # Check if food is found
-            if any(p == food.position for food in foods):
-                found_food = True
-                if count > 20 and exit_routes > 0:  # Exit if we found food and have exit routes
-                    return count + 100 + exit_routes * 30
-            
-            # Check if power-up is found
-            if any(p == powerup.position for powerup in power_ups):
-                found_power_up = True
-                if count > 15 and exit_routes > 0:  # Exit if we found power-up and have exit routes
-                    return count + 150 + exit_routes * 30
-            
-            count += 1
-            
-            # Add neighbors
-            for direction in Direction.all_directions():
-                dx, dy = direction.value
-                neighbor = (x + dx, y + dy)
-                if neighbor not in visited and neighbor not in obstacles:
-                    to_visit.add(neighbor)
+                # Check if power-up is found
+                if cell & CELL_POWER_UP:
+                    found_power_up = True
+                    if count > 15 and exit_routes > 0:  # Exit if we found power-up and have exit routes
+                        return count + 150 + exit_routes * 30
+                
+                count += 1
+                
+                # Add neighbors
+                for dx, dy in DIRECTION_OFFSETS:
+                    if not grid[idx + dy * width + dx] & (CELL_OBSTACLE | CELL_VISITED):
+                        to_visit.add((x + dx, y + dy))
+        finally:
+            for idx in visited:
+                grid[idx] &= ~CELL_VISITED
         
         # Calculate score based on findings
         space_score = count
@@ -918,214 +1012,194 @@ class Snake:
         
         return space_score
     
-    def is_safe(self, pos, obstacles, game_state):
+    def is_safe(self, pos, grid, game_state):
         """Check if position is safe (not a wall or other snake)"""
         x, y = pos
+        width = game_state.width
         
-        # First check for wall collisions
-        if x <= 0 or x >= game_state.width - 1 or y <= 0 or y >= game_state.height - 1:
+        # Positions off the board (invincible snakes can leave it) are never safe;
+        # on the board the wall bit of the grid covers the border, so a single
+        # lookup checks walls and snake bodies together
+        if not (0 <= x < width and 0 <= y < game_state.height):
             return False
+        return not grid[y * width + x] & CELL_BLOCKED
+    
+    def check_tunnel_safety(self, pos, direction, grid, game_state, block_start=False):
+        """Check if a tunnel (single path) eventually leads to an open space.
         
-        # Then check for snake body collisions
-        if pos in obstacles:
-            return False
+        Any CELL_BLOCKED cell of the occupancy `grid` counts as blocked; with
+        `block_start` the starting position does too. Cells followed through
+        the tunnel are marked with CELL_TUNNEL and cleared again before returning.
+        The walk runs on flat grid indices, so each step is a single addition.
+        """
+        width = game_state.width
+        x, y = pos
+        idx = y * width + x
+        dx, dy = direction.value
+        step = dy * width + dx
+        neighbor_steps = (-width, width, -1, 1)  # UP, DOWN, LEFT, RIGHT
+        followed = []
+        if block_start:
+            grid[idx] |= CELL_TUNNEL
+            followed.append(idx)
         
-        return True
-    
-    def check_tunnel_safety(self, pos, direction, obstacles, occupied, game_state):
-        """Check if a tunnel (single path) eventually leads to an open space"""
-        # Maximum tunnel length to check
-        max_tunnel_length = 15
-        current_pos = pos
-        
-        # Track positions we check to avoid loops
-        checked_positions = set(occupied)
-        
-        # Follow the tunnel
-        for i in range(max_tunnel_length):
-            # Move in the given direction
-            dx, dy = direction.value
-            next_pos = (current_pos[0] + dx, current_pos[1] + dy)
-            
-            # Check if hit wall or obstacle
-            x, y = next_pos
-            if (x <= 0 or x >= game_state.width - 1 or y <= 0 or y >= game_state.height - 1 or
-                next_pos in obstacles or next_pos in checked_positions):
-                return False  # Dead end
-            
-            # Add to checked positions
-            checked_positions.add(next_pos)
-            current_pos = next_pos
-            
-            # Count available directions from this position
-            available = 0
-            for test_dir in Direction.all_directions():
-                test_pos = (current_pos[0] + test_dir.value[0], current_pos[1] + test_dir.value[1])
-                test_x, test_y = test_pos
-                if (test_x <= 0 or test_x >= game_state.width - 1 or 
-                    test_y <= 0 or test_y >= game_state.height - 1 or 
-                    test_pos in obstacles or
-                    test_pos in checked_positions):
-                    continue
-                available += 1
-            
-            # If we found multiple options, it's not a pure tunnel anymore
-            if available > 1:
-                return True  # Tunnel leads to open space
-            
-            # If no directions available, it's a dead end
-            if available == 0:
-                return False
+        try:
+            # Follow the tunnel for at most 15 cells
+            for _ in range(15):
+                idx += step
+                
+                # Check if hit wall or obstacle
+                if grid[idx] & CELL_BLOCKED:
+                    return False  # Dead end
+                
+                grid[idx] |= CELL_TUNNEL
+                followed.append(idx)
+                
+                # Count available directions from this position
+                available = 0
+                for n_step in neighbor_steps:
+                    if not grid[idx + n_step] & CELL_BLOCKED:
+                        available += 1
+                        step = n_step
+                
+                # Multiple options means it's not a pure tunnel anymore
+                if available > 1:
+                    return True
+                
+                # No directions available means it's a dead end
+                if available == 0:
+                    return False
             
-            # If exactly one direction, continue following the tunnel
-            for test_dir in Direction.all_directions():
-                test_pos = (current_pos[0] + test_dir.value[0], current_pos[1] + test_dir.value[1])
-                test_x, test_y = test_pos
-                if (test_x <= 0 or test_x >= game_state.width - 1 or 
-                    test_y <= 0 or test_y >= game_state.height - 1 or 
-                    test_pos in obstacles or
-                    test_pos in checked_positions):
-                    continue
-                direction = test_dir
-                break
-        
-        # If we checked the maximum length and didn't find a dead end or opening,
-        # assume it's risky but not necessarily fatal
-        return False
+            # Checked the maximum length without finding a dead end or opening,
+            # assume it's risky but not necessarily fatal
+            return False
+        finally:
+            for idx in followed:
+                grid[idx] &= ~CELL_TUNNEL
     
-    def look_ahead(self, start_pos, direction, obstacles, game_state, steps):
-        """Improved simulation of future moves to detect potential collisions and traps"""
+    def look_ahead(self, start_pos, direction, grid, game_state, steps):
+        """Improved simulation of future moves to detect potential collisions and traps.
+        
+        `grid` is the occupancy grid stamped by GameState.stamp_grid. The cells
+        the simulated snake occupies are marked with CELL_PATH while simulating
+        and cleared again before returning, so the grid can be reused.
+        
+        Results are not memoized: every call against one stamped grid starts from a
+        different candidate cell, so a transposition table would never hit.
+        """
         if steps <= 0:
             return 10  # Base score for reaching the look-ahead depth safely
-            
-        # Clone the obstacles set to avoid modifying the original
-        future_obstacles = set(obstacles)
         
-        # Start simulating moves
-        current_pos = start_pos
+        width = game_state.width
+        
+        # Start simulating moves, marking the cells we would occupy
+        x, y = start_pos
+        start_idx = y * width + x
         current_direction = direction
-        positions = [current_pos]  # Track positions we would occupy
+        grid[start_idx] |= CELL_PATH
+        path = [start_idx]
         
         # Track available directions at each step to detect traps
         available_directions_count = []
         
-        for i in range(steps):
-            # Calculate next position
-            dx, dy = current_direction.value
-            next_pos = (current_pos[0] + dx, current_pos[1] + dy)
-            
-            # Check if next position would hit a wall
-            x, y = next_pos
-            if x <= 0 or x >= game_state.width - 1 or y <= 0 or y >= game_state.height - 1:
-                return -400  # Severely increased penalty for hitting a wall
-                
-            # Check if next position would hit an obstacle
-            if next_pos in future_obstacles:
-                return -300  # Severely increased penalty for hitting an obstacle
+        try:
+            for i in range(steps):
+                # Calculate next position
+                dx, dy = current_direction.value
+                x += dx
+                y += dy
                 
-            # Check if next position would hit our own future body
-            if next_pos in positions:
-                return -350  # Severely increased penalty for self-collision
+                # Check if next position would hit a wall
+                idx = y * width + x
+                cell = grid[idx]
+                if cell & CELL_WALL:
+                    return -400  # Severely increased penalty for hitting a wall
                 
-            # Move to next position
-            current_pos = next_pos
-            positions.append(current_pos)
-            
-            # Add our current position to obstacles for next simulation step
-            future_obstacles.add(current_pos)
-            
-            # Count available directions for this position
-            available = 0
-            available_directions = []
-            
-            for test_dir in Direction.all_directions():
-                if Direction.is_opposite(test_dir, current_direction):
-                    continue
-                test_pos = (current_pos[0] + test_dir.value[0], current_pos[1] + test_dir.value[1])
-                test_x, test_y = test_pos
-                if (test_x <= 0 or test_x >= game_state.width - 1 or 
-                    test_y <= 0 or test_y >= game_state.height - 1 or 
-                    test_pos in future_obstacles or
-                    test_pos in positions):
-                    continue
-                available += 1
-                available_directions.append(test_dir)
-            
-            available_directions_count.append(available)
-            
-            # If only one direction available, do a deeper check to see if it's a tunnel
-            if available == 1 and i < steps - 1:
-                # Check if this single available direction leads to a dead end
-                tunnel_dir = available_directions[0]
-                is_tunnel_safe = self.check_tunnel_safety(current_pos, tunnel_dir, future_obstacles, positions, game_state)
+                if cell & CELL_BLOCKED:
+                    if idx == start_idx:
+                        return -350  # Severely increased penalty for self-collision
+                    return -300  # Severely increased penalty for hitting an obstacle
                 
-                if not is_tunnel_safe:
-                    return -500  # Severely penalize tunnels with no exit
-            
-            # If no directions available, this is a trap!
-            elif available == 0 and i < steps - 1:
-                return -600  # Extremely penalize getting trapped
+                # Move to next position
+                grid[idx] |= CELL_PATH
+                path.append(idx)
                 
-            # For subsequent steps, choose the direction with most options 
-            # (more sophisticated than just continuing in the same direction)
-            if i < steps - 1:
-                best_dir = None
-                most_options = -1
+                # Count available directions for this position
+                available = 0
+                available_directions = []
+                opposite = OPPOSITE_DIRECTION[current_direction]
                 
-                for test_dir in Direction.all_directions():
-                    if Direction.is_opposite(test_dir, current_direction):
+                for test_dir, tdx, tdy, test_opposite in DIRECTION_DELTAS:
+                    if test_dir is opposite:
                         continue
-                    test_pos = (current_pos[0] + test_dir.value[0], current_pos[1] + test_dir.value[1])
-                    test_x, test_y = test_pos
-                    if (test_x <= 0 or test_x >= game_state.width - 1 or 
-                        test_y <= 0 or test_y >= game_state.height - 1 or 
-                        test_pos in future_obstacles or
-                        test_pos in positions):
+                    if grid[idx + tdy * width + tdx] & CELL_BLOCKED:
                         continue
+                    available += 1
+                    available_directions.append(test_dir)
+                
+                available_directions_count.append(available)
+                
+                # If only one direction available, do a deeper check to see if it's a tunnel
+                if available == 1 and i < steps - 1:
+                    # Check if this single available direction leads to a dead end
+                    if not self.check_tunnel_safety((x, y), available_directions[0], grid, game_state):
+                        return -500  # Severely penalize tunnels with no exit
+                
+                # If no directions available, this is a trap!
+                elif available == 0 and i < steps - 1:
+                    return -600  # Extremely penalize getting trapped
+                
+                # For subsequent steps, choose the direction with most options 
+                # (more sophisticated than just continuing in the same direction)
+                if i < steps - 1:
+                    best_dir = None
+                    most_options = -1
                     
-                    # Count options from this new position
-                    options = 0
-                    for next_dir in Direction.all_directions():
-                        if Direction.is_opposite(next_dir, test_dir):
+                    for test_dir, tdx, tdy, test_opposite in DIRECTION_DELTAS:
+                        if test_dir is opposite:
                             continue
-                        next_test_pos = (test_pos[0] + next_dir.value[0], test_pos[1] + next_dir.value[1])
-                        next_x, next_y = next_test_pos
-                        if (next_x <= 0 or next_x >= game_state.width - 1 or 
-                            next_y <= 0 or next_y >= game_state.height - 1 or 
-                            next_test_pos in future_obstacles or
-                            next_test_pos in positions):
+                        test_idx = idx + tdy * width + tdx
+                        if grid[test_idx] & CELL_BLOCKED:
                             continue
-                        options += 1
+                        
+                        # Count options from this new position
+                        options = 0
+                        for next_dir, ndx, ndy, _ in DIRECTION_DELTAS:
+                            if next_dir is test_opposite:
+                                continue
+                            if grid[test_idx + ndy * width + ndx] & CELL_BLOCKED:
+                                continue
+                            options += 1
+                        
+                        if options > most_options:
+                            most_options = options
+                            best_dir = test_dir
                     
-                    if options > most_options:
-                        most_options = options
-                        best_dir = test_dir
+                    # If found a better direction, use it
+                    if best_dir:
+                        current_direction = best_dir
+            
+            # Analyze the trend of available directions
+            # If consistently decreasing, it's heading into a confined space
+            if len(available_directions_count) >= 2:
+                if all(available_directions_count[i] > available_directions_count[i+1] 
+                       for i in range(len(available_directions_count)-1)):
+                    return -150  # Increased penalty for consistently decreasing options
                 
-                # If found a better direction, use it
-                if best_dir:
-                    current_direction = best_dir
-        
-        # Analyze the trend of available directions
-        # If consistently decreasing, it's heading into a confined space
-        if len(available_directions_count) >= 2:
-            if all(available_directions_count[i] > available_directions_count[i+1] 
-                   for i in range(len(available_directions_count)-1)):
-                return -150  # Increased penalty for consistently decreasing options
-            
-            # Especially penalize directions that end with very few options
-            if available_directions_count[-1] < 2:
-                return -200  # Significant penalty for ending with limited options
-        
-        # Calculate free space at final position with more weight
-        free_neighbors = 0
-        x, y = positions[-1]
-        for dx, dy in [(0,1), (1,0), (0,-1), (-1,0)]:
-            nx, ny = x + dx, y + dy
-            if (nx <= 0 or nx >= game_state.width - 1 or 
-                ny <= 0 or ny >= game_state.height - 1 or
-                (nx, ny) in future_obstacles):
-                continue
-            free_neighbors += 1
+                # Especially penalize directions that end with very few options
+                if available_directions_count[-1] < 2:
+                    return -200  # Significant penalty for ending with limited options
+            
+            # Calculate free space at final position with more weight
+            # (the starting cell is not an obstacle, only part of the simulated path)
+            free_neighbors = 0
+            for n_idx in (idx + width, idx + 1, idx - width, idx - 1):
+                if grid[n_idx] & CELL_BLOCKED and n_idx != start_idx:
+                    continue
+                free_neighbors += 1
+        finally:
+            for idx in path:
+                grid[idx] &= ~CELL_PATH
         
         # Apply distance-based penalties (with diminishing effect)
         # The further we can go without issues, the better
@@ -1137,26 +1211,48 @@ class Snake:
         # Return score based on simulated moves with increased weight for space and options
         return 50 + free_neighbors * 25 + step_completion_bonus + options_bonus
     
-    def choose_direction(self, foods, other_snakes_positions, power_ups, game_state):
-        """Advanced AI logic to choose the next direction with improved decision making"""
+    def choose_direction(self, foods, other_snakes_positions, power_ups, game_state, grid=None):
+        """Advanced AI logic to choose the next direction with improved decision making
+        
+        `grid` may be an occupancy grid already stamped for this snake's current
+        position (as move() does for its emergency check); otherwise one is stamped here.
+        """
         if not self.body:  # Check if body is empty
             return None
             
         head = self.body[0]
-        obstacles = set(other_snakes_positions) | set(self.body[1:])
-        
-        # Calculate danger zones (spaces next to other snake heads)
+        hx, hy = head
+        opposite = OPPOSITE_DIRECTION[self.direction]
+        if grid is None:
+            grid = game_state.stamp_grid(other_snakes_positions, islice(self.body, 1, None),
+                                         foods=foods, power_ups=power_ups)
+        width = game_state.width
+        height = game_state.height
+        
+        # Mark danger zones (spaces next to other snake heads) in the grid
         # This helps avoiding potential head-to-head collisions
-        danger_zones = set()
-        for other_snake in game_state.snakes:
-            if other_snake is not self and other_snake.alive and len(other_snake.body) >= len(self.body):
-                other_head = other_snake.body[0]
-                for direction in Direction.all_directions():
-                    danger_pos = (other_head[0] + direction.value[0], other_head[1] + direction.value[1])
+        max_x = width - 1
+        max_y = height - 1
+        body_len = len(self.body)
+        # Head x, head y and length of every other living snake, plus the longest one
+        # (first on ties), gathered once for the scorers
+        enemies = []
+        largest_enemy = None
+        largest_len = 0
+        for other in game_state.snakes:
+            if other is not self and other.alive:
+                other_len = len(other.body)
+                enemies.append((other.body[0][0], other.body[0][1], other_len))
+                if other_len > largest_len:
+                    largest_len = other_len
+                    largest_enemy = other
+        for ox, oy, enemy_len in enemies:
+            if enemy_len >= body_len:
+                for dx, dy in DIRECTION_OFFSETS:
+                    x, y = ox + dx, oy + dy
                     # Don't mark as danger if it's a wall (already avoided)
-                    x, y = danger_pos
-                    if not (x <= 0 or x >= game_state.width - 1 or y <= 0 or y >= game_state.height - 1):
-                        danger_zones.add(danger_pos)
+                    if 0 < x < max_x and 0 < y < max_y:
+                        grid[y * width + x] |= CELL_DANGER
         
         # Find food and power-ups with improved evaluation
         food_targets = []
@@ -1164,67 +1260,93 @@ class Snake:
         
         # For Scavenger strategy, prioritize dropped food
         dropped_food_bonus = 0
-        if self.strategy == AIStrategy.SCAVENGER:
+        if self.strategy is AIStrategy.SCAVENGER:
             dropped_food_bonus = 300
             
         # For Territorial strategy, establish a territory if none exists
-        if self.strategy == AIStrategy.TERRITORIAL and not self.territory_center:
+        if self.strategy is AIStrategy.TERRITORIAL and not self.territory_center:
             self.territory_center = (self.body[0][0], self.body[0][1])
         
+        # Per-type food bonus, resolved once instead of per food item
+        food_type_bonus = {
+            FoodType.BONUS: 200,
+            FoodType.DROPPED: 50 + dropped_food_bonus,  # Extra bonus for Scavenger strategy
+        }
+        
+        # Territorial strategy bonus/penalty based on distance from territory center
+        territory = None
+        if self.strategy is AIStrategy.TERRITORIAL and self.territory_center:
+            territory = self.territory_center
+        
+        # Obstacle counts along the head's row, prefix-summed once so every food's
+        # x-leg below takes two lookups (row_obstacles[x] counts cells 0..x-1);
+        # left as None when the head is off the board
+        row_obstacles = None
+        if 0 <= hx < width and 0 <= hy < height:
+            row = hy * width
+            row_obstacles = [0, *accumulate(grid[row:row + width].translate(OBSTACLE_BITS))]
+        
         # Evaluate each food item
         for food in foods:
             food_pos = food.position
-            dist = abs(head[0] - food_pos[0]) + abs(head[1] - food_pos[1])
+            fx, fy = food_pos
+            dist = abs(hx - fx) + abs(hy - fy)
+            
+            # Dropped food from a snake that died off the board can lie outside the grid
+            on_board = 0 <= fx < width and 0 <= fy < height
             
             # Check if path to food is reasonably clear
             path_score = 0
             
-            # Simplified path check for performance
-            # Check if there's a relatively clear path to the food
-            x_step = 1 if food_pos[0] > head[0] else -1 if food_pos[0] < head[0] else 0
-            y_step = 1 if food_pos[1] > head[1] else -1 if food_pos[1] < head[1] else 0
-            
-            # Sample points along potential path
-            path_clear = True
-            check_points = []
-            
-            # X-path
-            if x_step != 0:
-                for x in range(head[0] + x_step, food_pos[0] + x_step, x_step):
-                    check_points.append((x, head[1]))
-            
-            # Y-path
-            if y_step != 0:
-                for y in range(head[1] + y_step, food_pos[1] + y_step, y_step):
-                    check_points.append((food_pos[0], y))
-            
-            # Check sample points
-            obstacles_in_path = 0
-            for point in check_points:
-                if point in obstacles:
-                    obstacles_in_path += 1
-                    
-            # Path score reduced based on obstacles
-            if len(check_points) > 0:
-                path_score = 100 * (1 - obstacles_in_path / len(check_points))
-            
-            # Bonus for food type
-            type_bonus = 0
-            if hasattr(food, 'type'):
-                if food.type == FoodType.BONUS:
-                    type_bonus = 200
-                elif food.type == FoodType.DROPPED:
-                    type_bonus = 50 + dropped_food_bonus  # Extra bonus for Scavenger strategy
-            
-            # Territorial strategy bonus/penalty based on distance from territory center
+            # Simplified path check for performance: count obstacles along the
+            # L-shaped path (x first along the head row, then y along the food
+            # column, both excluding the head cell). With both ends on the board
+            # the whole path is too, and is counted from the row prefix sums and
+            # a column slice
+            if dist > 0:
+                obstacles_in_path = 0
+                if on_board and row_obstacles is not None:
+                    if fx > hx:
+                        obstacles_in_path += row_obstacles[fx + 1] - row_obstacles[hx + 1]
+                    elif fx < hx:
+                        obstacles_in_path += row_obstacles[hx] - row_obstacles[fx]
+                    if fy != hy:
+                        if fy > hy:
+                            leg = grid[(hy + 1) * width + fx:fy * width + fx + 1:width]
+                        else:
+                            leg = grid[fy * width + fx:hy * width + fx:width]
+                        obstacles_in_path += leg.translate(OBSTACLE_BITS).count(1)
+                else:
+                    # Part of the path is off the board (an invincible or ghost head
+                    # that left it, or food it dropped there). The grid holds nothing
+                    # out there but snake bodies can, so walk the path cells against
+                    # the position sets instead (the path never visits the head cell,
+                    # so body_set stands in for body[1:])
+                    body_set = self.body_set
+                    if fx != hx:
+                        x_step = 1 if fx > hx else -1
+                        for x in range(hx + x_step, fx + x_step, x_step):
+                            if (x, hy) in other_snakes_positions or (x, hy) in body_set:
+                                obstacles_in_path += 1
+                    if fy != hy:
+                        y_step = 1 if fy > hy else -1
+                        for y in range(hy + y_step, fy + y_step, y_step):
+                            if (fx, y) in other_snakes_positions or (fx, y) in body_set:
+                                obstacles_in_path += 1
+                
+                # Path score reduced based on obstacles
+                path_score = 100 * (1 - obstacles_in_path / dist)
+            
+            # Bonus for food type (every Food has a type, NORMAL by default)
+            type_bonus = food_type_bonus.get(food.type, 0)
+            
+            # Prefer food close to territory, penalty for food far away
             territorial_factor = 0
-            if self.strategy == AIStrategy.TERRITORIAL and self.territory_center:
-                dist_to_territory = abs(food_pos[0] - self.territory_center[0]) + abs(food_pos[1] - self.territory_center[1])
-                # Prefer food close to territory, penalty for food far away
-                territorial_factor = 200 - dist_to_territory * 10
+            if territory:
+                territorial_factor = 200 - (abs(fx - territory[0]) + abs(fy - territory[1])) * 10
             
             # Check if food is in a danger zone
-            danger_penalty = 200 if food_pos in danger_zones else 0
+            danger_penalty = 200 if on_board and grid[fy * width + fx] & CELL_DANGER else 0
             
             # Calculate final score for this food
             # Closer food is better, clear path is better, 
@@ -1234,36 +1356,39 @@ class Snake:
             food_targets.append((food_pos, food_score, dist))
         
         # Evaluate power-ups similarly to food
+        alive_count = None
         for power_up in power_ups:
             power_up_pos = power_up.position
-            dist = abs(head[0] - power_up_pos[0]) + abs(head[1] - power_up_pos[1])
+            dist = abs(hx - power_up_pos[0]) + abs(hy - power_up_pos[1])
             
             # Prioritize power-ups based on situation
             type_value = 0
-            if power_up.type == PowerUpType.INVINCIBILITY:
+            if power_up.type is PowerUpType.INVINCIBILITY:
                 # More valuable when longer
                 type_value = 300 if len(self.body) > 10 else 150
-            elif power_up.type == PowerUpType.GHOST:
+            elif power_up.type is PowerUpType.GHOST:
                 # More valuable when many snakes
-                type_value = 50 * len([s for s in game_state.snakes if s.alive])
-            elif power_up.type == PowerUpType.SPEED_BOOST:
+                if alive_count is None:
+                    alive_count = sum(1 for s in game_state.snakes if s.alive)
+                type_value = 50 * alive_count
+            elif power_up.type is PowerUpType.SPEED_BOOST:
                 # Generally useful
                 type_value = 150
-            elif power_up.type == PowerUpType.GROWTH:
+            elif power_up.type is PowerUpType.GROWTH:
                 # More valuable early game
                 type_value = 250 if game_state.death_counter <= 2 else 100
-            elif power_up.type == PowerUpType.SCORE_MULTIPLIER:
+            elif power_up.type is PowerUpType.SCORE_MULTIPLIER:
                 # More valuable when food is nearby
                 nearby_food = sum(1 for f in foods if abs(f.position[0] - power_up_pos[0]) + abs(f.position[1] - power_up_pos[1]) < 10)
                 type_value = 100 + 50 * nearby_food
             
             # Check if power-up is in a danger zone
-            danger_penalty = 150 if power_up_pos in danger_zones else 0
+            danger_penalty = 150 if grid[power_up_pos[1] * width + power_up_pos[0]] & CELL_DANGER else 0
             
             # Territorial strategy adjustment
             territorial_factor = 0
-            if self.strategy == AIStrategy.TERRITORIAL and self.territory_center:
-                dist_to_territory = abs(power_up_pos[0] - self.territory_center[0]) + abs(power_up_pos[1] - self.territory_center[1])
+            if territory:
+                dist_to_territory = abs(power_up_pos[0] - territory[0]) + abs(power_up_pos[1] - territory[1])
                 territorial_factor = 150 - dist_to_territory * 8
             
             # Calculate score
@@ -1275,166 +1400,193 @@ class Snake:
                 
             power_up_targets.append((power_up_pos, power_up_score, dist))
         
-        # Sort targets by score (descending)
-        food_targets.sort(key=lambda x: x[1], reverse=True)
-        power_up_targets.sort(key=lambda x: x[1], reverse=True)
-        
-        # Select primary target - best food or power-up
+        # Select primary target - best food or power-up (only the top entry of each
+        # list is needed, and max() keeps the first of equal scores like a stable sort)
+        best_food = max(food_targets, key=itemgetter(1)) if food_targets else None
+        best_power_up = max(power_up_targets, key=itemgetter(1)) if power_up_targets else None
         target = None
         target_score = 0
         
-        if food_targets and (not power_up_targets or food_targets[0][1] >= power_up_targets[0][1]):
-            target = food_targets[0][0]
-            target_score = food_targets[0][1]
-        elif power_up_targets:
-            target = power_up_targets[0][0]
-            target_score = power_up_targets[0][1]
+        if best_food and (not best_power_up or best_food[1] >= best_power_up[1]):
+            target, target_score, _ = best_food
+        elif best_power_up:
+            target, target_score, _ = best_power_up
         
         # If no target found, try to continue safely
         if not target:
             # Try to continue in same direction if safe
             next_pos = self.next_head()
-            if self.is_safe(next_pos, obstacles, game_state) and next_pos not in danger_zones:
+            if self.is_safe(next_pos, grid, game_state) and not grid[next_pos[1] * width + next_pos[0]] & CELL_DANGER:
                 return
             
             # Find any safe direction, preferring ones with most free space
             safe_directions = []
-            for direction in Direction.all_directions():
-                if Direction.is_opposite(direction, self.direction):
+            for direction, dx, dy, _ in DIRECTION_DELTAS:
+                if direction is opposite:
                     continue
-                next_pos = (head[0] + direction.value[0], head[1] + direction.value[1])
-                if self.is_safe(next_pos, obstacles, game_state):
+                next_pos = (hx + dx, hy + dy)
+                if self.is_safe(next_pos, grid, game_state):
                     # Calculate free space in this direction
-                    space = self.free_space(next_pos, obstacles, foods, power_ups, game_state)
-                    danger = 100 if next_pos in danger_zones else 0
+                    space = self.free_space(next_pos, grid, game_state)
+                    danger = 100 if grid[next_pos[1] * width + next_pos[0]] & CELL_DANGER else 0
                     safe_directions.append((direction, space - danger))
             
             if safe_directions:
                 # Choose direction with most free space
-                self.direction = max(safe_directions, key=lambda x: x[1])[0]
+                self.direction = max(safe_directions, key=itemgetter(1))[0]
             return
         
+        # Calculate direction to target
+        tx, ty = target
+        target_dx = tx - hx
+        target_dy = ty - hy
+        
         # Simple algorithm for many snakes to improve performance
         if Config.OPTIMIZE_FOR_LARGE_GAMES and len(game_state.snakes) >= Config.LARGE_GAME_THRESHOLD:
             # First priority: avoid immediate collisions
             next_pos = self.next_head()
-            if not self.is_safe(next_pos, obstacles, game_state) or next_pos in danger_zones:
+            if not self.is_safe(next_pos, grid, game_state) or grid[next_pos[1] * width + next_pos[0]] & CELL_DANGER:
                 # Current direction is unsafe, find a safe one
                 safe_directions = []
-                for direction in Direction.all_directions():
-                    if Direction.is_opposite(direction, self.direction):
+                for direction, dx, dy, _ in DIRECTION_DELTAS:
+                    if direction is opposite:
                         continue
-                    new_head = (head[0] + direction.value[0], head[1] + direction.value[1])
-                    if self.is_safe(new_head, obstacles, game_state) and new_head not in danger_zones:
+                    nx, ny = hx + dx, hy + dy
+                    if self.is_safe((nx, ny), grid, game_state) and not grid[ny * width + nx] & CELL_DANGER:
                         # Calculate distance to target for this direction
-                        dist = abs(new_head[0] - target[0]) + abs(new_head[1] - target[1])
+                        dist = abs(nx - tx) + abs(ny - ty)
                         safe_directions.append((direction, dist))
                 
                 if safe_directions:
                     # Sort by distance to target (ascending)
-                    safe_directions.sort(key=lambda x: x[1])
+                    safe_directions.sort(key=itemgetter(1))
                     # Choose the direction that gets us closest to target
                     self.direction = safe_directions[0][0]
-                elif any(self.is_safe((head[0] + d.value[0], head[1] + d.value[1]), obstacles, game_state) 
-                        for d in Direction.all_directions() if not Direction.is_opposite(d, self.direction)):
+                else:
                     # If no safe direction without danger, just pick any safe direction
-                    for direction in Direction.all_directions():
-                        if Direction.is_opposite(direction, self.direction):
+                    for direction, dx, dy, _ in DIRECTION_DELTAS:
+                        if direction is opposite:
                             continue
-                        new_head = (head[0] + direction.value[0], head[1] + direction.value[1])
-                        if self.is_safe(new_head, obstacles, game_state):
+                        if self.is_safe((hx + dx, hy + dy), grid, game_state):
                             self.direction = direction
                             break
                 return
                 
-            # Move towards target if possible
-            target_dx = target[0] - head[0]
-            target_dy = target[1] - head[1]
-            
-            # Determine if we should move horizontally or vertically based on which gets us closer
+            # Move towards target if possible: decide whether moving horizontally or
+            # vertically gets us closer
             if abs(target_dx) > abs(target_dy):
                 # Try horizontal movement first
                 new_dir = Direction.RIGHT if target_dx > 0 else Direction.LEFT
-                if not Direction.is_opposite(new_dir, self.direction):
-                    new_head = (head[0] + new_dir.value[0], head[1] + new_dir.value[1])
-                    if self.is_safe(new_head, obstacles, game_state) and new_head not in danger_zones:
+                if new_dir is self.direction:
+                    return  # Already heading that way, and the check above found it safe
+                if new_dir is not opposite:
+                    new_head = self._next_head_xy(new_dir)
+                    if self.is_safe(new_head, grid, game_state) and not grid[new_head[1] * width + new_head[0]] & CELL_DANGER:
                         self.direction = new_dir
                         return
                 
                 # Try vertical if horizontal doesn't work
                 new_dir = Direction.DOWN if target_dy > 0 else Direction.UP
-                if not Direction.is_opposite(new_dir, self.direction):
-                    new_head = (head[0] + new_dir.value[0], head[1] + new_dir.value[1])
-                    if self.is_safe(new_head, obstacles, game_state) and new_head not in danger_zones:
+                if new_dir is not opposite:
+                    new_head = self._next_head_xy(new_dir)
+                    if self.is_safe(new_head, grid, game_state) and not grid[new_head[1] * width + new_head[0]] & CELL_DANGER:
                         self.direction = new_dir
                         return
-                    elif self.is_safe(new_head, obstacles, game_state):  # Accept danger if necessary
+                    elif self.is_safe(new_head, grid, game_state):  # Accept danger if necessary
                         self.direction = new_dir
                         return
             else:
                 # Try vertical movement first
                 new_dir = Direction.DOWN if target_dy > 0 else Direction.UP
-                if not Direction.is_opposite(new_dir, self.direction):
-                    new_head = (head[0] + new_dir.value[0], head[1] + new_dir.value[1])
-                    if self.is_safe(new_head, obstacles, game_state) and new_head not in danger_zones:
+                if new_dir is self.direction:
+                    return  # Already heading that way, and the check above found it safe
+                if new_dir is not opposite:
+                    new_head = self._next_head_xy(new_dir)
+                    if self.is_safe(new_head, grid, game_state) and not grid[new_head[1] * width + new_head[0]] & CELL_DANGER:
                         self.direction = new_dir
                         return
                 
                 # Try horizontal if vertical doesn't work
                 new_dir = Direction.RIGHT if target_dx > 0 else Direction.LEFT
-                if not Direction.is_opposite(new_dir, self.direction):
-                    new_head = (head[0] + new_dir.value[0], head[1] + new_dir.value[1])
-                    if self.is_safe(new_head, obstacles, game_state) and new_head not in danger_zones:
+                if new_dir is not opposite:
+                    new_head = self._next_head_xy(new_dir)
+                    if self.is_safe(new_head, grid, game_state) and not grid[new_head[1] * width + new_head[0]] & CELL_DANGER:
                         self.direction = new_dir
                         return
-                    elif self.is_safe(new_head, obstacles, game_state):  # Accept danger if necessary
+                    elif self.is_safe(new_head, grid, game_state):  # Accept danger if necessary
                         self.direction = new_dir
                         return
             
             # Continue in same direction if it's safe (already checked above)
             return
         
-        # Calculate direction to target
-        target_dx = target[0] - head[0]
-        target_dy = target[1] - head[1]
-        
         # Dynamically adjust strategy based on game situation
         # This makes AI adaptable to changing conditions
-        if self.strategy == AIStrategy.AGGRESSIVE and len(self.body) < 5:
+        if self.strategy is AIStrategy.AGGRESSIVE and len(self.body) < 5:
             # Be less aggressive when small
             temp_strategy = AIStrategy.OPPORTUNISTIC
-        elif self.strategy == AIStrategy.HUNTER and len(game_state.snakes) <= 2:
+        elif self.strategy is AIStrategy.HUNTER and len(game_state.snakes) <= 2:
             # No point being a hunter with few snakes
             temp_strategy = AIStrategy.AGGRESSIVE
-        elif self.strategy == AIStrategy.CAUTIOUS and game_state.death_counter > len(game_state.snakes) / 2:
+        elif self.strategy is AIStrategy.CAUTIOUS and game_state.death_counter > len(game_state.snakes) / 2:
             # Be more aggressive in late game
             temp_strategy = AIStrategy.OPPORTUNISTIC
         else:
             temp_strategy = self.strategy
         
+        # The strategy is fixed for the whole decision: pick its scorer and the
+        # safety modes it can enter once, outside the candidate loop
+        scorer = self._STRATEGY_SCORERS.get(temp_strategy)
+        can_enter_survival = self.strategy in SURVIVAL_STRATEGIES
+        is_reckless = self.strategy in RECKLESS_STRATEGIES
+        # Survival mode scores without the strategy score, but the opportunistic
+        # scorer (which a late-game CAUTIOUS snake uses) draws its jitter from the
+        # shared random stream, so it still runs there to keep later draws in step
+        score_in_survival = temp_strategy is AIStrategy.OPPORTUNISTIC
+        
+        # What sits on the target is the same for every candidate
+        target_is_dropped = any(f.position == target and f.type is FoodType.DROPPED for f in foods)
+        target_power_up_type = next((p.type for p in power_ups if p.position == target), None)
+        current_direction = self.direction
+        
+        # Keep frame times steady in crowded games: once this tick's AI budget is
+        # spent, the remaining snakes only simulate a few steps ahead
+        if time.time() < game_state.ai_deadline:
+            look_ahead_steps = Config.LOOK_AHEAD_STEPS
+        else:
+            look_ahead_steps = Config.MIN_LOOK_AHEAD_STEPS
+        inner_right = width - 2   # Columns/rows right next to the walls
+        inner_bottom = height - 2
+        open_space_weight = Config.OPEN_SPACE_WEIGHT
+        survival_threshold = Config.SURVIVAL_THRESHOLD
+        
         # Evaluate each possible direction with look-ahead
         candidates = []
-        for direction in Direction.all_directions():
+        shared = {}  # Lets scorers compute candidate-independent parts once
+        for direction, dx, dy, _ in DIRECTION_DELTAS:
             # Skip opposite direction
-            if Direction.is_opposite(direction, self.direction):
+            if direction is opposite:
                 continue
             
             # Get next position in this direction
-            dx, dy = direction.value
-            new_head = (head[0] + dx, head[1] + dy)
+            nx, ny = hx + dx, hy + dy
             
-            # Skip if not safe
-            if not self.is_safe(new_head, obstacles, game_state):
+            # Skip if not safe (is_safe inlined so unsafe moves never build a position tuple)
+            if not (0 <= nx < width and 0 <= ny < height) or grid[ny * width + nx] & CELL_BLOCKED:
                 continue
+            new_head = (nx, ny)  # Shared by every helper and scorer below
             
             # Look ahead further (6 steps instead of 4)
-            future_score = self.look_ahead(new_head, direction, obstacles, game_state, Config.LOOK_AHEAD_STEPS)
+            # Every safe candidate is scored in full: the tunnel check, the close-score
+            # space tie-break and loop avoidance below all re-rank the whole list, so a
+            # best-so-far bound cannot skip look_ahead without changing the final pick
+            future_score = self.look_ahead(new_head, direction, grid, game_state, look_ahead_steps)
             if future_score < -100:  # Increased threshold
                 # This direction leads to certain death, skip it
                 continue
             
             # Distance to target
-            manhattan_to_target = abs(new_head[0] - target[0]) + abs(new_head[1] - target[1])
+            manhattan_to_target = abs(nx - tx) + abs(ny - ty)
             
             # Calculate more factors for decision making
             
@@ -1442,9 +1594,9 @@ class Snake:
             target_score = 500 - 20 * manhattan_to_target
             
             # Direct path to target gets bonus
-            if (target_dx > 0 and dx > 0) or (target_dx < 0 and dx < 0):  # Moving in correct x direction
+            if dx * target_dx > 0:  # Moving in correct x direction
                 target_score += 150
-            if (target_dy > 0 and dy > 0) or (target_dy < 0 and dy < 0):  # Moving in correct y direction
+            if dy * target_dy > 0:  # Moving in correct y direction
                 target_score += 150
             
             # Immediate adjacent to target gets huge bonus
@@ -1452,353 +1604,51 @@ class Snake:
                 target_score += 1500
                 
             # 2. Space evaluation - now with much higher priority for survival
-            space = self.free_space(new_head, obstacles, foods, power_ups, game_state)
-            space_score = Config.OPEN_SPACE_WEIGHT * space  # Significantly increased weight for space
+            space = self.free_space(new_head, grid, game_state)
+            space_score = open_space_weight * space  # Significantly increased weight for space
             
             # Much higher penalty for confined spaces to ensure exit paths
-            if space < Config.SURVIVAL_THRESHOLD:
+            if space < survival_threshold:
                 space_score -= 600  # Severe penalty
             elif space < 15:
                 space_score -= 300  # Significant penalty
             
             # 3. Danger zone avoidance
-            danger_score = -250 if new_head in danger_zones else 0
+            danger_score = -250 if grid[ny * width + nx] & CELL_DANGER else 0
             
             # Adjust danger score based on snake size - bigger snakes can be more aggressive
-            if len(self.body) > 15:
+            if body_len > 15:
                 danger_score = danger_score * 0.5  # Half penalty for big snakes
             
             # 4. Look-ahead bonus
             look_ahead_score = future_score * 0.8  # Increased weight
             
             # 5. Preference for continuing in same direction (smoother movement)
-            direction_score = 75 if direction == self.direction else 0
+            direction_score = 75 if direction is current_direction else 0
             
             # 6. Wall proximity penalty - avoid moving along walls when not necessary
             wall_score = 0
-            if new_head[0] == 1 or new_head[0] == game_state.width - 2:  # Near vertical walls
+            if nx == 1 or nx == inner_right:  # Near vertical walls
                 wall_score -= 30
-            if new_head[1] == 1 or new_head[1] == game_state.height - 2:  # Near horizontal walls
+            if ny == 1 or ny == inner_bottom:  # Near horizontal walls
                 wall_score -= 30
             
-            # 7. Strategy-specific scoring
-            strategy_score = 0
-            
-            if temp_strategy == AIStrategy.AGGRESSIVE:
-                # Aggressive: Go straight for target, ignore most danger
-                strategy_score = target_score * 3.0 - danger_score * 0.3  # Much more aggressive
-                # If close to target, be extremely aggressive
-                if manhattan_to_target < 5:
-                    strategy_score += 800
-                # Significantly less concerned with space
-                space_weight_reduction = min(0.6, 1.0 - len(self.body) * 0.02)  # Bigger snakes care less about space
-                strategy_score -= space_score * space_weight_reduction
-            
-            elif temp_strategy == AIStrategy.CAUTIOUS:
-                # Cautious: Value space and safety more than target
-                strategy_score = space_score * 2.5 + look_ahead_score * 2.0 - danger_score * 1.5
-                # But still go for target if it's very close
-                if manhattan_to_target < 2:
-                    strategy_score += target_score * 1.5
-            
-            elif temp_strategy == AIStrategy.OPPORTUNISTIC:
-                # Opportunistic: Balance target and space, change direction based on situation
-                strategy_score = target_score * 1.5 + space_score * 1.2 - danger_score * 0.8 + random.randint(0, 100)
-                # More aggressive when target is close
-                if manhattan_to_target < 5:
-                    strategy_score += 300
-                # More cautious when space is limited
-                if space < 12:
-                    strategy_score += space_score * 1.2
-            
-            elif temp_strategy == AIStrategy.DEFENSIVE:
-                # Defensive: Stay away from other snakes
-                snake_proximity = 0
-                for pos in other_snakes_positions:
-                    dist = abs(new_head[0] - pos[0]) + abs(new_head[1] - pos[1])
-                    if dist < 5:
-                        snake_proximity += (5 - dist) * 35
-                
-                strategy_score = target_score * 0.8 + space_score * 1.8 - snake_proximity * 1.8 + look_ahead_score * 1.5
-                # Stronger space preference
-                if space < 20:
-                    strategy_score += space_score * 2
-                # Still go for target if it's very close
-                if manhattan_to_target < 3:
-                    strategy_score += 300
-            
-            elif temp_strategy == AIStrategy.HUNTER:
-                # Hunter: Target other snake heads to try to kill them
-                hunter_score = 0
-                for other_snake in game_state.snakes:
-                    if other_snake is not self and other_snake.alive:
-                        other_head = other_snake.body[0]
-                        dist = abs(new_head[0] - other_head[0]) + abs(new_head[1] - other_head[1])
-                        
-                        # More aggressive hunting - consider attacking even smaller snakes
-                        size_advantage = len(self.body) - len(other_snake.body)
-                        
-                        # Only hunt if we're bigger or same size
-                        if size_advantage >= 0 and dist < 8:
-                            # Perfect position for head-on collision when we're bigger
-                            if dist == 2 and size_advantage > 0:  
-                                hunter_score += 800
-                            # Within hunting range
-                            elif dist < 5:  
-                                hunter_score += (8 - dist) * 120
-                
-                strategy_score = hunter_score + target_score * 0.4 + space_score * 0.7
-                # Don't forget food when it's very close
-                if manhattan_to_target < 3:
-                    strategy_score += target_score * 0.8
-                    
-            elif temp_strategy == AIStrategy.SCAVENGER:
-                # Scavenger: Prioritize dropped food and safety over aggression
-                is_dropped_target = any(f.position == target and f.type == FoodType.DROPPED for f in foods)
-                dropped_bonus = 800 if is_dropped_target else 0
-                
-                strategy_score = target_score * 1.2 + space_score * 1.2 + dropped_bonus - danger_score * 1.0
-                # Less cautious overall, more focused on finding dropped food
-                if not is_dropped_target:
-                    strategy_score += look_ahead_score * 1.2
-                    
-            elif temp_strategy == AIStrategy.TERRITORIAL:
-                # Territorial: Prefer staying in a specific area but more aggressive in defense
-                if self.territory_center:
-                    territory_dist = abs(new_head[0] - self.territory_center[0]) + abs(new_head[1] - self.territory_center[1])
-                    # Higher score for staying close to territory center
-                    territory_score = 400 - territory_dist * 12
-                    
-                    # Check if any other snakes are in our territory
-                    invaders = 0
-                    for other_snake in game_state.snakes:
-                        if other_snake is not self and other_snake.alive:
-                            other_head = other_snake.body[0]
-                            dist_to_territory = abs(other_head[0] - self.territory_center[0]) + abs(other_head[1] - self.territory_center[1])
-                            if dist_to_territory < 8:  # Close to our territory
-                                invaders += 1
-                                invader_dist = abs(new_head[0] - other_head[0]) + abs(new_head[1] - other_head[1])
-                                if invader_dist < 5:  # We're close to invader
-                                    # Become more aggressive to defend territory
-                                    territory_score += (5 - invader_dist) * 150
-                    
-                    # Balance between territory defense and food/space
-                    strategy_score = target_score * 0.7 + space_score * 1.0 + territory_score
-                    
-                    # If far from territory, prioritize getting back
-                    if territory_dist > 10:
-                        strategy_score += territory_score * 2
-                else:
-                    # No territory yet, behave opportunistically until established
-                    strategy_score = target_score + space_score * 1.5
-                    
-            elif temp_strategy == AIStrategy.BERSERKER:
-                # Berserker: Super aggressive, minimal safety checks
-                # Target score is massively important
-                strategy_score = target_score * 5.0 - danger_score * 0.2
-                
-                # Almost no concern for space unless critically low
-                if space < 5:  # Only care about space if it's extremely confined
-                    strategy_score += space_score * 0.5
-                
-                # Even more aggressive when target is close
-                if manhattan_to_target < 6:
-                    strategy_score += 1000
-                
-                # Also aggressive toward other snakes
-                for other_snake in game_state.snakes:
-                    if other_snake is not self and other_snake.alive:
-                        other_head = other_snake.body[0]
-                        dist = abs(new_head[0] - other_head[0]) + abs(new_head[1] - other_head[1])
-                        
-                        # If we're bigger and close, consider attacking
-                        if len(self.body) > len(other_snake.body) and dist < 4:
-                            strategy_score += (4 - dist) * 200
-                
-            elif temp_strategy == AIStrategy.INTERCEPTOR:
-                # Interceptor: Tries to cut off other snakes' paths to food
-                intercept_score = 0
-                
-                # Identify other snakes close to food
-                for food_item in foods:
-                    food_pos = food_item.position
-                    food_value = food_item.points
-                    
-                    # Find snakes heading toward this food
-                    for other_snake in game_state.snakes:
-                        if other_snake is not self and other_snake.alive:
-                            other_head = other_snake.body[0]
-                            other_dist = abs(other_head[0] - food_pos[0]) + abs(other_head[1] - food_pos[1])
-                            
-                            # If another snake is close to food
-                            if other_dist < 8:
-                                # Calculate ideal intercept position
-                                intercept_x = (food_pos[0] + other_head[0]) // 2
-                                intercept_y = (food_pos[1] + other_head[1]) // 2
-                                
-                                # Calculate our distance to intercept
-                                intercept_dist = abs(head[0] - intercept_x) + abs(head[1] - intercept_y)
-                                
-                                # Higher score for closer intercepts with more valuable food
-                                if intercept_dist < 10:
-                                    intercept_value = (food_value * 100) / (intercept_dist + 1)
-                                    intercept_score += intercept_value
-                
-                # Balance between interception and normal targeting
-                strategy_score = intercept_score + target_score * 0.6 + space_score * 0.8
-                
-            elif temp_strategy == AIStrategy.POWERUP_SEEKER:
-                # PowerUp Seeker: Prioritizes power-ups above all else
-                powerup_score = 0
-                
-                # Check if we're targeting a power-up
-                is_powerup_target = any(p.position == target for p in power_ups)
-                
-                if is_powerup_target:
-                    # Massively boost score for power-up targets
-                    powerup_score = 1500
-                    
-                    # Check which type of power-up
-                    for p in power_ups:
-                        if p.position == target:
-                            # Additional bonus based on power-up type
-                            if p.type == PowerUpType.INVINCIBILITY:
-                                powerup_score += 300
-                            elif p.type == PowerUpType.GHOST:
-                                powerup_score += 250
-                            elif p.type == PowerUpType.SPEED_BOOST:
-                                powerup_score += 200
-                            break
-                else:
-                    # If not targeting a power-up, normal scoring but with slight preference for being in center
-                    center_dist = abs(new_head[0] - game_state.width//2) + abs(new_head[1] - game_state.height//2)
-                    center_bonus = 100 - (center_dist * 2)
-                    strategy_score = target_score * 0.7 + space_score + center_bonus
-                
-                strategy_score = powerup_score + target_score * 0.5 + space_score * 0.8
-                
-            elif temp_strategy == AIStrategy.STALKER:
-                # Stalker: Follows the largest snake, waiting for opportunity
-                stalker_score = 0
-                target_snake = None
-                max_size = 0
-                
-                # Find the largest snake
-                for other_snake in game_state.snakes:
-                    if other_snake is not self and other_snake.alive and len(other_snake.body) > max_size:
-                        max_size = len(other_snake.body)
-                        target_snake = other_snake
-                
-                if target_snake:
-                    target_head = target_snake.body[0]
-                    target_tail = target_snake.body[-1]
-                    
-                    head_dist = abs(new_head[0] - target_head[0]) + abs(new_head[1] - target_head[1])
-                    tail_dist = abs(new_head[0] - target_tail[0]) + abs(new_head[1] - target_tail[1])
-                    
-                    # Prefer to stay close but not too close to the target snake
-                    if head_dist < 3:  # Too close to head - might be dangerous
-                        stalker_score -= 200
-                    elif head_dist < 6:  # Ideal distance to track
-                        stalker_score += 600 - (head_dist * 50)
-                    elif head_dist < 12:  # Still tracking but further
-                        stalker_score += 300 - (head_dist * 20)
-                    
-                    # Bonus for being near the tail - good to pick up dropped food
-                    if tail_dist < 5:
-                        stalker_score += 250 - (tail_dist * 30)
-                
-                # Balance between stalking and normal targeting
-                strategy_score = stalker_score + target_score * 0.6 + space_score
-                
-            elif temp_strategy == AIStrategy.TRAP_SETTER:
-                # Trap Setter: Creates loops and traps for other snakes
-                trap_score = 0
-                
-                # Check if we're near a wall - good for creating traps
-                wall_dist = min(
-                    new_head[0],  # Distance to left wall
-                    game_state.width - 1 - new_head[0],  # Distance to right wall
-                    new_head[1],  # Distance to top wall
-                    game_state.height - 1 - new_head[1]  # Distance to bottom wall
-                )
-                
-                # Prefer to stay near walls but not right against them
-                if wall_dist == 1:
-                    trap_score += 200
-                elif wall_dist == 2:
-                    trap_score += 300
-                elif wall_dist == 3:
-                    trap_score += 100
-                
-                # Check for other snakes nearby to trap
-                for other_snake in game_state.snakes:
-                    if other_snake is not self and other_snake.alive:
-                        other_head = other_snake.body[0]
-                        dist = abs(new_head[0] - other_head[0]) + abs(new_head[1] - other_head[1])
-                        
-                        if dist < 8:  # Snake is close enough to potentially trap
-                            # Calculate position where we might cut off their path
-                            # Prefer to be in their most likely path to food
-                            for food_item in foods:
-                                food_dist = abs(other_head[0] - food_item.position[0]) + abs(other_head[1] - food_item.position[1])
-                                if food_dist < 10:  # Food is close to other snake
-                                    # Position between snake and food is ideal for trapping
-                                    mid_x = (other_head[0] + food_item.position[0]) // 2
-                                    mid_y = (other_head[1] + food_item.position[1]) // 2
-                                    
-                                    # Distance to ideal trap position
-                                    trap_pos_dist = abs(new_head[0] - mid_x) + abs(new_head[1] - mid_y)
-                                    if trap_pos_dist < 5:
-                                        trap_score += (5 - trap_pos_dist) * 150
-                
-                # Balance between trapping and normal strategy
-                strategy_score = trap_score + target_score * 0.7 + space_score
-                
-            elif temp_strategy == AIStrategy.KAMIKAZE:
-                # Kamikaze: Grows quickly then charges at other snakes
-                kamikaze_score = 0
-                
-                # Early game strategy - focus on growth
-                if len(self.body) < 15:
-                    # Be food-focused to grow quickly
-                    strategy_score = target_score * 2.5 + space_score * 0.5
-                    
-                    # More aggressive for nearby food
-                    if manhattan_to_target < 4:
-                        strategy_score += 500
-                else:
-                    # Late game - target other snakes aggressively
-                    for other_snake in game_state.snakes:
-                        if other_snake is not self and other_snake.alive:
-                            other_head = other_snake.body[0]
-                            dist = abs(new_head[0] - other_head[0]) + abs(new_head[1] - other_head[1])
-                            
-                            if dist < 10:  # Close enough to charge
-                                # Charge regardless of size
-                                charge_score = 1000 - (dist * 100)
-                                kamikaze_score += charge_score
-                                
-                                # Even more aggressive when in striking distance
-                                if dist < 3:
-                                    kamikaze_score += 1000
-                    
-                    # Ignore safety concerns when charging
-                    strategy_score = kamikaze_score + target_score * 0.3
-                    
-                    # Almost zero concern for space
-                    if space < 3:  # Only care if critically confined
-                        strategy_score += space_score * 0.3
-            
             # Safety check - enter survival mode if space is dangerously low
             # Only certain strategies will enter survival mode, others will be more reckless
-            survival_strategies = [AIStrategy.CAUTIOUS, AIStrategy.DEFENSIVE, AIStrategy.SCAVENGER, AIStrategy.TERRITORIAL]
-            reckless_strategies = [AIStrategy.BERSERKER, AIStrategy.KAMIKAZE]
-            
-            survival_mode = space < Config.SURVIVAL_THRESHOLD and self.strategy in survival_strategies
+            survival_mode = can_enter_survival and space < survival_threshold
             
             # Super aggressive strategies like BERSERKER and KAMIKAZE ignore danger completely unless extremely confined
-            reckless_mode = self.strategy in reckless_strategies and space > 3
+            reckless_mode = is_reckless and space > 3
+            
+            # 7. Strategy-specific scoring (survival mode scores without it, so skip it there
+            # unless the scorer draws from the random stream)
+            strategy_score = 0
+            if scorer is not None and (score_in_survival or not survival_mode):
+                strategy_score = scorer(self, ScoreContext(
+                    new_head, head, target, target_score, space, space_score, danger_score,
+                    look_ahead_score, manhattan_to_target, foods, target_is_dropped,
+                    target_power_up_type, other_snakes_positions, enemies, largest_enemy,
+                    shared, game_state))
             
             if survival_mode:
                 # In survival mode, prioritize space and exit routes above all else
@@ -1833,10 +1683,11 @@ class Snake:
                     look_ahead_score * 0.8  # Reduced future safety importance
                 )
             
-            # Add a small bit of randomness to break ties
-            total_score += random.uniform(-5, 5)
+            # Add a small bit of randomness to break ties (the same value
+            # random.uniform(-5, 5) returns, minus its call overhead)
+            total_score += -5 + 10 * random.random()
             
-            candidates.append((direction, total_score))
+            candidates.append((direction, total_score, space))
         
         # Choose direction with highest score, with additional checks
         if candidates:
@@ -1845,42 +1696,38 @@ class Snake:
             if len(candidates) <= 2 and Config.TUNNEL_CHECK_ENABLED:
                 # For each candidate, do an extended safety check
                 safe_candidates = []
-                for dir_candidate, score in candidates:
-                    next_pos = (head[0] + dir_candidate.value[0], head[1] + dir_candidate.value[1])
-                    is_safe_path = self.check_tunnel_safety(head, dir_candidate, obstacles, set(self.body), game_state)
+                for dir_candidate, score, space in candidates:
+                    is_safe_path = self.check_tunnel_safety(head, dir_candidate, grid, game_state, block_start=True)
                     if is_safe_path:
-                        safe_candidates.append((dir_candidate, score))
+                        safe_candidates.append((dir_candidate, score, space))
                     else:
                         # If not safe, significantly reduce the score
-                        safe_candidates.append((dir_candidate, score - 500))
+                        safe_candidates.append((dir_candidate, score - 500, space))
                         
                 candidates = safe_candidates
             
-            # Sort candidates by score for better decision making
-            sorted_candidates = sorted(candidates, key=lambda x: x[1], reverse=True)
+            # Only the best two candidates matter, so pick them out in one pass
+            # (ties keep the earlier candidate first, as a stable sort would)
+            best = second = None
+            for candidate in candidates:
+                if best is None or candidate[1] > best[1]:
+                    second, best = best, candidate
+                elif second is None or candidate[1] > second[1]:
+                    second = candidate
+            best_dir, best_score, best_space = best
             
             # Choose the highest scoring direction
             self.prev_direction = self.direction
-            self.direction = sorted_candidates[0][0]
+            self.direction = best_dir
             
             # Additional safety measure: if highest-scoring direction has nearly the same score
             # as the second-best but the second-best has more free space, prefer that
-            if len(sorted_candidates) > 1:
-                best_score = sorted_candidates[0][1]
-                second_score = sorted_candidates[1][1]
+            if second is not None:
+                second_dir, second_score, second_space = second
                 
                 # If scores are close (within 10%)
                 if second_score > 0 and best_score > 0 and (best_score - second_score) / best_score < 0.1:
-                    best_dir = sorted_candidates[0][0]
-                    second_dir = sorted_candidates[1][0]
-                    
-                    # Check free space for both
-                    best_pos = (head[0] + best_dir.value[0], head[1] + best_dir.value[1])
-                    second_pos = (head[0] + second_dir.value[0], head[1] + second_dir.value[1])
-                    
-                    best_space = self.free_space(best_pos, obstacles, foods, power_ups, game_state)
-                    second_space = self.free_space(second_pos, obstacles, foods, power_ups, game_state)
-                    
+                    # Both free space counts were taken in the scoring loop on this same grid.
                     # If second direction has significantly more space, choose it instead
                     if second_space > best_space * 1.5:
                         self.direction = second_dir
@@ -1893,11 +1740,421 @@ class Snake:
             
             # Avoid loops by occasionally changing direction if many consecutive moves
             if self.consecutive_moves > 10 and random.random() < 0.5:  # More aggressive loop avoidance
-                alternative_dirs = [d for d, _ in sorted_candidates if d != self.direction]
-                if alternative_dirs:
-                    self.direction = alternative_dirs[0]  # Take the highest-scoring alternative
+                if second is not None:
+                    # Take the highest-scoring alternative
+                    self.direction = second_dir if self.direction is best_dir else best_dir
                     self.consecutive_moves = 0
 
+    def _score_aggressive(self, ctx):
+        """Aggressive: Go straight for target, ignore most danger"""
+        target_score = ctx.target_score
+        space_score = ctx.space_score
+        danger_score = ctx.danger_score
+        manhattan_to_target = ctx.manhattan_to_target
+
+        strategy_score = target_score * 3.0 - danger_score * 0.3  # Much more aggressive
+        # If close to target, be extremely aggressive
+        if manhattan_to_target < 5:
+            strategy_score += 800
+        # Significantly less concerned with space
+        space_weight_reduction = min(0.6, 1.0 - len(self.body) * 0.02)  # Bigger snakes care less about space
+        strategy_score -= space_score * space_weight_reduction
+        return strategy_score
+
+    def _score_cautious(self, ctx):
+        """Cautious: Value space and safety more than target"""
+        target_score = ctx.target_score
+        space_score = ctx.space_score
+        danger_score = ctx.danger_score
+        look_ahead_score = ctx.look_ahead_score
+        manhattan_to_target = ctx.manhattan_to_target
+
+        strategy_score = space_score * 2.5 + look_ahead_score * 2.0 - danger_score * 1.5
+        # But still go for target if it's very close
+        if manhattan_to_target < 2:
+            strategy_score += target_score * 1.5
+        return strategy_score
+
+    def _score_opportunistic(self, ctx):
+        """Opportunistic: Balance target and space, change direction based on situation"""
+        target_score = ctx.target_score
+        space = ctx.space
+        space_score = ctx.space_score
+        danger_score = ctx.danger_score
+        manhattan_to_target = ctx.manhattan_to_target
+
+        # Random 0-100 jitter drawn straight from getrandbits with rejection, the same
+        # draw random.randint(0, 100) makes without its randrange call overhead
+        jitter = random.getrandbits(7)
+        while jitter > 100:
+            jitter = random.getrandbits(7)
+
+        strategy_score = target_score * 1.5 + space_score * 1.2 - danger_score * 0.8 + jitter
+        # More aggressive when target is close
+        if manhattan_to_target < 5:
+            strategy_score += 300
+        # More cautious when space is limited
+        if space < 12:
+            strategy_score += space_score * 1.2
+        return strategy_score
+
+    def _score_defensive(self, ctx):
+        """Defensive: Stay away from other snakes"""
+        new_head = ctx.new_head
+        target_score = ctx.target_score
+        space = ctx.space
+        space_score = ctx.space_score
+        look_ahead_score = ctx.look_ahead_score
+        manhattan_to_target = ctx.manhattan_to_target
+        other_snakes_positions = ctx.other_snakes_positions
+
+        snake_proximity = 0
+        for pos in other_snakes_positions:
+            dist = abs(new_head[0] - pos[0]) + abs(new_head[1] - pos[1])
+            if dist < 5:
+                snake_proximity += (5 - dist) * 35
+        
+        strategy_score = target_score * 0.8 + space_score * 1.8 - snake_proximity * 1.8 + look_ahead_score * 1.5
+        # Stronger space preference
+        if space < 20:
+            strategy_score += space_score * 2
+        # Still go for target if it's very close
+        if manhattan_to_target < 3:
+            strategy_score += 300
+        return strategy_score
+
+    def _score_hunter(self, ctx):
+        """Hunter: Target other snake heads to try to kill them"""
+        new_head = ctx.new_head
+        target_score = ctx.target_score
+        space_score = ctx.space_score
+        manhattan_to_target = ctx.manhattan_to_target
+
+        # Only hunt if we're bigger or same size. Sizes don't change between
+        # candidates, so the prey list is filtered once per decision
+        prey = ctx.shared.get('hunter_prey')
+        if prey is None:
+            body_len = len(self.body)
+            prey = [(ex, ey, body_len > enemy_len)
+                    for ex, ey, enemy_len in ctx.enemies if enemy_len <= body_len]
+            ctx.shared['hunter_prey'] = prey
+        
+        nx, ny = new_head
+        hunter_score = 0
+        for ex, ey, is_bigger in prey:
+            dist = abs(nx - ex) + abs(ny - ey)
+            
+            # More aggressive hunting - consider attacking even smaller snakes
+            if dist < 8:
+                # Perfect position for head-on collision when we're bigger
+                if dist == 2 and is_bigger:  
+                    hunter_score += 800
+                # Within hunting range
+                elif dist < 5:  
+                    hunter_score += (8 - dist) * 120
+        
+        strategy_score = hunter_score + target_score * 0.4 + space_score * 0.7
+        # Don't forget food when it's very close
+        if manhattan_to_target < 3:
+            strategy_score += target_score * 0.8
+        return strategy_score
+
+    def _score_scavenger(self, ctx):
+        """Scavenger: Prioritize dropped food and safety over aggression"""
+        target_score = ctx.target_score
+        space_score = ctx.space_score
+        danger_score = ctx.danger_score
+        look_ahead_score = ctx.look_ahead_score
+
+        is_dropped_target = ctx.target_is_dropped
+        dropped_bonus = 800 if is_dropped_target else 0
+        
+        strategy_score = target_score * 1.2 + space_score * 1.2 + dropped_bonus - danger_score * 1.0
+        # Less cautious overall, more focused on finding dropped food
+        if not is_dropped_target:
+            strategy_score += look_ahead_score * 1.2
+        return strategy_score
+
+    def _score_territorial(self, ctx):
+        """Territorial: Prefer staying in a specific area but more aggressive in defense"""
+        new_head = ctx.new_head
+        target_score = ctx.target_score
+        space_score = ctx.space_score
+
+        if self.territory_center:
+            tx, ty = self.territory_center
+            territory_dist = abs(new_head[0] - tx) + abs(new_head[1] - ty)
+            # Higher score for staying close to territory center
+            territory_score = 400 - territory_dist * 12
+            
+            # Check if any other snakes are in our territory (the same for every candidate)
+            invaders = ctx.shared.get('invaders')
+            if invaders is None:
+                invaders = [(ex, ey) for ex, ey, _ in ctx.enemies
+                            if abs(ex - tx) + abs(ey - ty) < 8]  # Close to our territory
+                ctx.shared['invaders'] = invaders
+            for ex, ey in invaders:
+                invader_dist = abs(new_head[0] - ex) + abs(new_head[1] - ey)
+                if invader_dist < 5:  # We're close to invader
+                    # Become more aggressive to defend territory
+                    territory_score += (5 - invader_dist) * 150
+            
+            # Balance between territory defense and food/space
+            strategy_score = target_score * 0.7 + space_score * 1.0 + territory_score
+            
+            # If far from territory, prioritize getting back
+            if territory_dist > 10:
+                strategy_score += territory_score * 2
+        else:
+            # No territory yet, behave opportunistically until established
+            strategy_score = target_score + space_score * 1.5
+        return strategy_score
+
+    def _score_berserker(self, ctx):
+        """Berserker: Super aggressive, minimal safety checks"""
+        new_head = ctx.new_head
+        target_score = ctx.target_score
+        space = ctx.space
+        space_score = ctx.space_score
+        danger_score = ctx.danger_score
+        manhattan_to_target = ctx.manhattan_to_target
+
+        # Target score is massively important
+        strategy_score = target_score * 5.0 - danger_score * 0.2
+        
+        # Almost no concern for space unless critically low
+        if space < 5:  # Only care about space if it's extremely confined
+            strategy_score += space_score * 0.5
+        
+        # Even more aggressive when target is close
+        if manhattan_to_target < 6:
+            strategy_score += 1000
+        
+        # Also aggressive toward other snakes we're bigger than
+        prey = ctx.shared.get('berserker_prey')
+        if prey is None:
+            body_len = len(self.body)
+            prey = [(ex, ey) for ex, ey, enemy_len in ctx.enemies if body_len > enemy_len]
+            ctx.shared['berserker_prey'] = prey
+        
+        nx, ny = new_head
+        for ex, ey in prey:
+            dist = abs(nx - ex) + abs(ny - ey)
+            
+            # If we're close, consider attacking
+            if dist < 4:
+                strategy_score += (4 - dist) * 200
+        return strategy_score
+
+    def _score_interceptor(self, ctx):
+        """Interceptor: Tries to cut off other snakes' paths to food"""
+        head = ctx.head
+        target_score = ctx.target_score
+        space_score = ctx.space_score
+
+        # Interception is measured from the current head, so it is the same for
+        # every candidate and only computed for the first one
+        intercept_score = ctx.shared.get('intercept_score')
+        if intercept_score is None:
+            enemies = ctx.enemies
+            hx, hy = head
+            intercept_score = 0
+            
+            # Identify other snakes close to food
+            for food_item in ctx.foods:
+                fx, fy = food_item.position
+                food_value = food_item.points
+                
+                # Find snakes heading toward this food
+                for ex, ey, _ in enemies:
+                    other_dist = abs(ex - fx) + abs(ey - fy)
+                    
+                    # If another snake is close to food
+                    if other_dist < 8:
+                        # Calculate our distance to the ideal intercept position
+                        intercept_dist = abs(hx - (fx + ex) // 2) + abs(hy - (fy + ey) // 2)
+                        
+                        # Higher score for closer intercepts with more valuable food
+                        if intercept_dist < 10:
+                            intercept_score += (food_value * 100) / (intercept_dist + 1)
+            ctx.shared['intercept_score'] = intercept_score
+        
+        # Balance between interception and normal targeting
+        strategy_score = intercept_score + target_score * 0.6 + space_score * 0.8
+        return strategy_score
+
+    def _score_powerup_seeker(self, ctx):
+        """PowerUp Seeker: Prioritizes power-ups above all else"""
+        target_score = ctx.target_score
+        space_score = ctx.space_score
+
+        powerup_score = 0
+        
+        # Check if we're targeting a power-up
+        power_up_type = ctx.target_power_up_type
+        
+        if power_up_type is not None:
+            # Massively boost score for power-up targets
+            powerup_score = 1500
+            
+            # Additional bonus based on power-up type
+            if power_up_type is PowerUpType.INVINCIBILITY:
+                powerup_score += 300
+            elif power_up_type is PowerUpType.GHOST:
+                powerup_score += 250
+            elif power_up_type is PowerUpType.SPEED_BOOST:
+                powerup_score += 200
+        
+        strategy_score = powerup_score + target_score * 0.5 + space_score * 0.8
+        return strategy_score
+
+    def _score_stalker(self, ctx):
+        """Stalker: Follows the largest snake, waiting for opportunity"""
+        new_head = ctx.new_head
+        target_score = ctx.target_score
+        space_score = ctx.space_score
+
+        stalker_score = 0
+        
+        # Follow the largest snake
+        target_snake = ctx.largest_enemy
+        if target_snake:
+            target_head = target_snake.body[0]
+            target_tail = target_snake.body[-1]
+            
+            head_dist = abs(new_head[0] - target_head[0]) + abs(new_head[1] - target_head[1])
+            tail_dist = abs(new_head[0] - target_tail[0]) + abs(new_head[1] - target_tail[1])
+            
+            # Prefer to stay close but not too close to the target snake
+            if head_dist < 3:  # Too close to head - might be dangerous
+                stalker_score -= 200
+            elif head_dist < 6:  # Ideal distance to track
+                stalker_score += 600 - (head_dist * 50)
+            elif head_dist < 12:  # Still tracking but further
+                stalker_score += 300 - (head_dist * 20)
+            
+            # Bonus for being near the tail - good to pick up dropped food
+            if tail_dist < 5:
+                stalker_score += 250 - (tail_dist * 30)
+        
+        # Balance between stalking and normal targeting
+        strategy_score = stalker_score + target_score * 0.6 + space_score
+        return strategy_score
+
+    def _score_trap_setter(self, ctx):
+        """Trap Setter: Creates loops and traps for other snakes"""
+        new_head = ctx.new_head
+        target_score = ctx.target_score
+        space_score = ctx.space_score
+        game_state = ctx.game_state
+
+        trap_score = 0
+        
+        # Check if we're near a wall - good for creating traps
+        nx, ny = new_head
+        width = game_state.width
+        if 0 <= nx < width and 0 <= ny < game_state.height:
+            wall_dist = game_state.wall_distance[ny * width + nx]
+        else:
+            wall_dist = 0  # Off the board (invincible), not near a wall in any useful sense
+        
+        # Prefer to stay near walls but not right against them
+        if wall_dist == 1:
+            trap_score += 200
+        elif wall_dist == 2:
+            trap_score += 300
+        elif wall_dist == 3:
+            trap_score += 100
+        
+        # Where we might cut off other snakes' paths: midway between each snake and
+        # the food close to it. These points don't depend on the candidate, so they
+        # are worked out once per decision
+        trap_points = ctx.shared.get('trap_points')
+        if trap_points is None:
+            trap_points = []
+            for ex, ey, _ in ctx.enemies:
+                midpoints = []
+                for food_item in ctx.foods:
+                    fx, fy = food_item.position
+                    if abs(ex - fx) + abs(ey - fy) < 10:  # Food is close to other snake
+                        midpoints.append(((ex + fx) // 2, (ey + fy) // 2))
+                trap_points.append((ex, ey, midpoints))
+            ctx.shared['trap_points'] = trap_points
+        
+        # Check for other snakes nearby to trap
+        for ex, ey, midpoints in trap_points:
+            dist = abs(nx - ex) + abs(ny - ey)
+            
+            if dist < 8:  # Snake is close enough to potentially trap
+                for mid_x, mid_y in midpoints:
+                    # Distance to ideal trap position
+                    trap_pos_dist = abs(nx - mid_x) + abs(ny - mid_y)
+                    if trap_pos_dist < 5:
+                        trap_score += (5 - trap_pos_dist) * 150
+        
+        # Balance between trapping and normal strategy
+        strategy_score = trap_score + target_score * 0.7 + space_score
+        return strategy_score
+
+    def _score_kamikaze(self, ctx):
+        """Kamikaze: Grows quickly then charges at other snakes"""
+        new_head = ctx.new_head
+        target_score = ctx.target_score
+        space = ctx.space
+        space_score = ctx.space_score
+        manhattan_to_target = ctx.manhattan_to_target
+
+        kamikaze_score = 0
+        
+        # Early game strategy - focus on growth
+        if len(self.body) < 15:
+            # Be food-focused to grow quickly
+            strategy_score = target_score * 2.5 + space_score * 0.5
+            
+            # More aggressive for nearby food
+            if manhattan_to_target < 4:
+                strategy_score += 500
+        else:
+            # Late game - target other snakes aggressively
+            nx, ny = new_head
+            for ex, ey, _ in ctx.enemies:
+                dist = abs(nx - ex) + abs(ny - ey)
+                
+                if dist < 10:  # Close enough to charge
+                    # Charge regardless of size
+                    charge_score = 1000 - (dist * 100)
+                    kamikaze_score += charge_score
+                    
+                    # Even more aggressive when in striking distance
+                    if dist < 3:
+                        kamikaze_score += 1000
+            
+            # Ignore safety concerns when charging
+            strategy_score = kamikaze_score + target_score * 0.3
+            
+            # Almost zero concern for space
+            if space < 3:  # Only care if critically confined
+                strategy_score += space_score * 0.3
+        return strategy_score
+
+    # Strategy -> scorer, looked up once per decision in choose_direction. Scorers are
+    # plain functions called as scorer(snake, ScoreContext); strategies without an
+    # entry add no strategy-specific score and skip building the context
+    _STRATEGY_SCORERS = {
+        AIStrategy.AGGRESSIVE: _score_aggressive,
+        AIStrategy.CAUTIOUS: _score_cautious,
+        AIStrategy.OPPORTUNISTIC: _score_opportunistic,
+        AIStrategy.DEFENSIVE: _score_defensive,
+        AIStrategy.HUNTER: _score_hunter,
+        AIStrategy.SCAVENGER: _score_scavenger,
+        AIStrategy.TERRITORIAL: _score_territorial,
+        AIStrategy.BERSERKER: _score_berserker,
+        AIStrategy.INTERCEPTOR: _score_interceptor,
+        AIStrategy.POWERUP_SEEKER: _score_powerup_seeker,
+        AIStrategy.STALKER: _score_stalker,
+        AIStrategy.TRAP_SETTER: _score_trap_setter,
+        AIStrategy.KAMIKAZE: _score_kamikaze,
+    }
 
 # =============================================================================
 # GAME STATE CLASS
@@ -1916,6 +2173,8 @@ class GameState:
         self.power_ups = []
         self.temp_foods = []
         self.obstacles = []  # New list for obstacles
+        self.obstacles_at = {}  # Position -> obstacles there (kept in step by add_obstacle)
+        self.acid_trails = []  # Acid spots left by snakes with the ACID_TRAIL power-up
         self.death_counter = 1
         self.start_time = time.time()
         self.last_food_time = time.time()
@@ -1930,6 +2189,27 @@ class GameState:
         self.difficulty = "Normal"  # Default difficulty
         self.special_event_timer = 0  # Timer for special events
         self.special_event_active = False  # Flag for special events
+        
+        # Flat occupancy grid (index = y * width + x) reused by the AI each decision.
+        # The border is pre-marked as wall so lookups double as bounds checks.
+        wall_grid = bytearray(width * height)
+        for x in range(width):
+            wall_grid[x] = CELL_WALL
+            wall_grid[(height - 1) * width + x] = CELL_WALL
+        for y in range(height):
+            wall_grid[y * width] = CELL_WALL
+            wall_grid[y * width + width - 1] = CELL_WALL
+        self._wall_grid = bytes(wall_grid)
+        self.grid = wall_grid
+        
+        # Distance from each cell to the nearest board edge, same indexing as the grid
+        self.wall_distance = bytes(
+            min(x, width - 1 - x, y, height - 1 - y, 255)
+            for y in range(height) for x in range(width)
+        )
+        
+        # Time after which AI decisions this tick use the short look ahead (set in update)
+        self.ai_deadline = float('inf')
     
     def initialize_game(self):
         """Initialize game elements"""
@@ -1948,7 +2228,7 @@ class GameState:
         # If this is the initial setup, clear all obstacles
         if avoid_positions is None:
             # Clear existing obstacles
-            self.obstacles = []
+            self.clear_obstacles()
             avoid_positions = set()
         
         # Create pair of wormholes (teleport points)
@@ -1959,8 +2239,8 @@ class GameState:
             for _ in range(2):
                 attempts = 0
                 while attempts < 50:
-                    x = random.randint(2, self.width - 3)
-                    y = random.randint(2, self.height - 3)
+                    x = random.randrange(2, self.width - 2)
+                    y = random.randrange(2, self.height - 2)
                     pos = (x, y)
                     
                     # Check if position is clear and not in avoid_positions
@@ -1978,8 +2258,8 @@ class GameState:
                 wormhole1.linked_position = wormhole_positions[1]
                 wormhole2.linked_position = wormhole_positions[0]
                 
-                self.obstacles.append(wormhole1)
-                self.obstacles.append(wormhole2)
+                self.add_obstacle(wormhole1)
+                self.add_obstacle(wormhole2)
         
         # Create a single random obstacle (for special events) or all obstacles (initial setup)
         obstacle_count = Config.OBSTACLE_COUNT if avoid_positions is None else 1
@@ -1995,8 +2275,8 @@ class GameState:
             # Try to find a good position
             attempts = 0
             while attempts < 50:
-                x = random.randint(2, self.width - 3)
-                y = random.randint(2, self.height - 3)
+                x = random.randrange(2, self.width - 2)
+                y = random.randrange(2, self.height - 2)
                 pos = (x, y)
                 
                 # Check if position is clear and not in avoid_positions
@@ -2009,7 +2289,7 @@ class GameState:
                         return len(positions_created) > 0  # Created successfully
                     else:
                         # Create a single obstacle
-                        self.obstacles.append(Obstacle(pos, obstacle_type))
+                        self.add_obstacle(Obstacle(pos, obstacle_type))
                         return True  # Created successfully
                 attempts += 1
                 
@@ -2051,18 +2331,28 @@ class GameState:
                     positions.append(new_pos)
                     added.add(new_pos)
                     new_obstacle = Obstacle(new_pos, obstacle_type)
-                    self.obstacles.append(new_obstacle)
+                    self.add_obstacle(new_obstacle)
                     created_obstacles.append(new_obstacle)
                     break
         
         # Create the first obstacle (start position)
         if start_pos not in avoid_positions:
             start_obstacle = Obstacle(start_pos, obstacle_type)
-            self.obstacles.append(start_obstacle)
+            self.add_obstacle(start_obstacle)
             created_obstacles.append(start_obstacle)
             
         return created_obstacles
     
+    def add_obstacle(self, obstacle):
+        """Place an obstacle on the board and index it by position"""
+        self.obstacles.append(obstacle)
+        self.obstacles_at.setdefault(obstacle.position, []).append(obstacle)
+    
+    def clear_obstacles(self):
+        """Remove every obstacle from the board"""
+        self.obstacles = []
+        self.obstacles_at = {}
+    
     def is_position_clear(self, pos, min_distance=3):
         """Check if a position is clear of other objects"""
         x, y = pos
@@ -2097,9 +2387,27 @@ class GameState:
         
         return True
     
+    def stamp_grid(self, *position_groups, foods=(), power_ups=()):
+        """Reset the occupancy grid to bare walls and mark the given positions as obstacles,
+        plus the cells holding `foods` and `power_ups`"""
+        grid = self.grid
+        grid[:] = self._wall_grid
+        width, height = self.width, self.height
+        for positions in position_groups:
+            for x, y in positions:
+                if 0 <= x < width and 0 <= y < height:
+                    grid[y * width + x] |= CELL_OBSTACLE
+        for items, flag in ((foods, CELL_FOOD), (power_ups, CELL_POWER_UP)):
+            for item in items:
+                x, y = item.position
+                if 0 <= x < width and 0 <= y < height:
+                    grid[y * width + x] |= flag
+        return grid
+    
     def create_snakes(self):
         """Create snakes based on configuration"""
         self.snakes = []
+        self.current_leader = None
         
         # Create human player if selected
         if self.human_player:
@@ -2121,37 +2429,6 @@ class GameState:
         # Create AI snakes with different strategies - favoring aggressive ones
         ai_strategies = list(AIStrategy)
         
-        # Define aggressive strategies with higher weights for selection
-        aggressive_strategies = [
-            AIStrategy.AGGRESSIVE,
-            AIStrategy.HUNTER,
-            AIStrategy.BERSERKER,
-            AIStrategy.KAMIKAZE,
-            AIStrategy.INTERCEPTOR
-        ]
-        
-        # Define tactical strategies with medium weights
-        tactical_strategies = [
-            AIStrategy.OPPORTUNISTIC,
-            AIStrategy.TERRITORIAL,
-            AIStrategy.TRAP_SETTER,
-            AIStrategy.STALKER
-        ]
-        
-        # Define defensive strategies with lower weights
-        defensive_strategies = [
-            AIStrategy.CAUTIOUS,
-            AIStrategy.DEFENSIVE,
-            AIStrategy.SCAVENGER,
-            AIStrategy.POWERUP_SEEKER
-        ]
-        
-        # Create a weighted strategy pool to favor more aggressive behavior
-        weighted_strategies = []
-        weighted_strategies.extend(aggressive_strategies * 5)  # 5x weight for aggressive
-        weighted_strategies.extend(tactical_strategies * 3)    # 3x weight for tactical
-        weighted_strategies.extend(defensive_strategies * 1)   # 1x weight for defensive
-        
         # Ensure a good distribution of strategies for AI snakes
         if ai_snakes <= len(ai_strategies):
             # Guarantee at least one berserker and one kamikaze for excitement
@@ -2160,10 +2437,10 @@ class GameState:
                 strategies.append(AIStrategy.BERSERKER)
                 strategies.append(AIStrategy.KAMIKAZE)
                 # Fill the rest with weighted random selection
-                strategies.extend(random.sample(weighted_strategies, ai_snakes - 2))
+                strategies.extend(random.sample(WEIGHTED_STRATEGIES, ai_snakes - 2))
             else:
                 # Just one snake - make it aggressive
-                strategies = [random.choice(aggressive_strategies)]
+                strategies = [random.choice(AGGRESSIVE_STRATEGIES)]
         else:
             # Use all strategies at least once, then add extras with weighting
             strategies = ai_strategies.copy()
@@ -2171,7 +2448,7 @@ class GameState:
             
             # Add extras based on weighted selection
             for _ in range(remaining):
-                strategies.append(random.choice(weighted_strategies))
+                strategies.append(random.choice(WEIGHTED_STRATEGIES))
                 
             random.shuffle(strategies)
         
@@ -2244,14 +2521,15 @@ class GameState:
     
     def create_initial_food(self):
         """Create initial food items for game start"""
+        all_positions = self._food_blocked_positions()
         for _ in range(Config.MIN_FOOD_COUNT):
-            self.create_food()
+            self.create_food(all_positions=all_positions)
         
         # Create one bonus food at start for excitement
-        self.create_food(FoodType.BONUS)
+        self.create_food(FoodType.BONUS, all_positions)
     
-    def create_food(self, food_type=FoodType.NORMAL):
-        """Create a new food item in a valid location"""
+    def _food_blocked_positions(self):
+        """Positions new food must not be placed on"""
         all_positions = set()
         
         # Collect positions of all objects
@@ -2260,39 +2538,33 @@ class GameState:
         all_positions.update(f.position for f in self.foods)
         all_positions.update(p.position for p in self.power_ups)
         all_positions.update(o.position for o in self.obstacles)  # Avoid obstacles too
+        return all_positions
+    
+    def create_food(self, food_type=FoodType.NORMAL, all_positions=None):
+        """Create a new food item in a valid location.
         
-        # Prevent food from spawning on the border
-        border_positions = set()
-        for x in range(self.width):
-            border_positions.add((x, 0))
-            border_positions.add((x, self.height - 1))
-        for y in range(self.height):
-            border_positions.add((0, y))
-            border_positions.add((self.width - 1, y))
-            
-        all_positions.update(border_positions)
+        Batch callers can pass `all_positions` from _food_blocked_positions();
+        it is updated with the new food so it stays valid for the next call.
+        """
+        if all_positions is None:
+            all_positions = self._food_blocked_positions()
         
-        # Try to find a valid position
+        # Try to find a valid position (only inside the border is ever sampled)
         attempts = 0
         while attempts < 100:  # Limit attempts to avoid infinite loop
-            pos = (random.randint(1, self.width-2), random.randint(1, self.height-2))
+            pos = (random.randrange(1, self.width-1), random.randrange(1, self.height-1))
             if pos not in all_positions:
                 break
             attempts += 1
             
         if attempts >= 100:
-            # Fallback: try to find any free position
-            for x in range(1, self.width-1):
-                for y in range(1, self.height-1):
-                    pos = (x, y)
-                    if pos not in all_positions:
-                        break
-                else:
-                    continue
-                break
-            else:
+            # Fallback: pick from the free cells that are left
+            free_positions = [(x, y) for x in range(1, self.width-1) for y in range(1, self.height-1)
+                              if (x, y) not in all_positions]
+            if not free_positions:
                 # No free positions found, don't create food
                 return None
+            pos = random.choice(free_positions)
         
         # Set appearance and points based on food type
         points = Config.FOOD_POINTS
@@ -2310,36 +2582,30 @@ class GameState:
         
         food = Food(position=pos, type=food_type, points=points, char=char, color=color)
         self.foods.append(food)
+        all_positions.add(pos)
         self.last_food_time = time.time()
         return food
     
-    def create_power_up(self):
-        """Create a new power-up item"""
-        all_positions = set()
-        
+    def _power_up_blocked_positions(self):
+        """Positions new power-ups must not be placed on"""
         # Avoid placing power-ups on snakes, food, other power-ups, or obstacles
-        for snake in self.snakes:
-            all_positions.update(snake.body_set)
-        all_positions.update(f.position for f in self.foods)
-        all_positions.update(p.position for p in self.power_ups)
+        all_positions = self._food_blocked_positions()
         all_positions.update(f.position for f in self.temp_foods)
-        all_positions.update(o.position for o in self.obstacles)  # Avoid obstacles too
+        return all_positions
+    
+    def create_power_up(self, all_positions=None):
+        """Create a new power-up item.
         
-        # Avoid borders
-        border_positions = set()
-        for x in range(self.width):
-            border_positions.add((x, 0))
-            border_positions.add((x, self.height - 1))
-        for y in range(self.height):
-            border_positions.add((0, y))
-            border_positions.add((self.width - 1, y))
-            
-        all_positions.update(border_positions)
+        Like create_food, batch callers can pass a shared `all_positions` set
+        (from _power_up_blocked_positions()) that is kept up to date here.
+        """
+        if all_positions is None:
+            all_positions = self._power_up_blocked_positions()
         
-        # Try multiple times to find a good position
+        # Try multiple times to find a good position (inside the border)
         attempts = 0
         while attempts < 50:
-            pos = (random.randint(1, self.width-2), random.randint(1, self.height-2))
+            pos = (random.randrange(1, self.width-1), random.randrange(1, self.height-1))
             if pos not in all_positions:
                 break
             attempts += 1
@@ -2349,19 +2615,17 @@ class GameState:
         
         power_up = PowerUp(position=pos)
         self.power_ups.append(power_up)
+        all_positions.add(pos)
         return power_up
     
     def drop_snake_as_food(self, snake):
         """Turn a defeated snake's body into food"""
-        for pos in snake.body:
-            self.temp_foods.append(Food(
-                position=pos,
-                type=FoodType.DROPPED,
-                points=Config.TEMP_FOOD_POINTS,
-                char=":",
-                color=6
-            ))
-        snake.body = []
+        points = Config.TEMP_FOOD_POINTS
+        self.temp_foods.extend(
+            Food(position=pos, type=FoodType.DROPPED, points=points, char=":", color=6)
+            for pos in snake.body
+        )
+        snake.body = deque()
         snake.body_set = set()
     
     def update(self):
@@ -2372,15 +2636,21 @@ class GameState:
         # Increment frame counter for visual effects
         self.frame_count += 1
         
+        # One clock reading for this tick's timers (the AI budget below keeps
+        # reading the real clock, since it measures time spent in the tick)
+        now = time.time()
+        
         # Update game speed
-        self.update_game_speed()
+        self.update_game_speed(now)
         
         # Update special event state
         self.update_special_event()
         
         # Make sure we have enough food
-        while len(self.foods) < Config.MIN_FOOD_COUNT:
-            self.create_food()
+        if len(self.foods) < Config.MIN_FOOD_COUNT:
+            all_positions = self._food_blocked_positions()
+            while len(self.foods) < Config.MIN_FOOD_COUNT:
+                self.create_food(all_positions=all_positions)
         
         # Check and update power-ups for each snake
         for snake in self.snakes:
@@ -2389,7 +2659,7 @@ class GameState:
                 
                 # Apply magnetic effect for snakes with that power-up
                 if snake.has_power_up(PowerUpType.MAGNETIC):
-                    snake.apply_magnetic_pull(self.foods + self.temp_foods)
+                    snake.apply_magnetic_pull(chain(self.foods, self.temp_foods))
                 
                 # Apply food rain effect
                 if snake.has_power_up(PowerUpType.FOOD_RAIN) and snake.body:
@@ -2406,13 +2676,9 @@ class GameState:
                         pos = (head[0] + dx, head[1] + dy)
                         
                         # Check if position is valid (not on wall, snake, etc.)
-                        all_positions = set()
-                        for s in self.snakes:
-                            all_positions.update(s.body_set)
-                        
                         if (1 < pos[0] < self.width-1 and 
                             1 < pos[1] < self.height-1 and 
-                            pos not in all_positions):
+                            not any(pos in s.body_set for s in self.snakes)):
                             
                             self.foods.append(Food(
                                 position=pos,
@@ -2429,59 +2695,70 @@ class GameState:
                         # Create an acid spot at the snake's second segment
                         acid_pos = snake.body[1]
                         
-                        # Store acid trails in a new attribute if needed
-                        if not hasattr(self, 'acid_trails'):
-                            self.acid_trails = []
-                            
                         # Add acid trail with limited lifetime
                         self.acid_trails.append({
                             'position': acid_pos,
                             'created_by': snake.id,
-                            'end_time': time.time() + 3  # 3 seconds lifetime
+                            'end_time': now + 3  # 3 seconds lifetime
                         })
         
         # Check and process acid trails
-        if hasattr(self, 'acid_trails'):
-            current_time = time.time()
+        if self.acid_trails:
+            current_time = now
             active_trails = []
             
+            # Group the snakes by head position so each trail only looks at the
+            # snakes standing on it (in the usual snake order)
+            snakes_at = {}
+            for snake in self.snakes:
+                if snake.alive and snake.body:
+                    snakes_at.setdefault(snake.body[0], []).append(snake)
+            
             for trail in self.acid_trails:
                 # Keep only active trails
                 if current_time < trail['end_time']:
                     active_trails.append(trail)
                     
                     # Check if any snake hit an acid trail (except creator)
-                    for snake in self.snakes:
+                    for snake in snakes_at.get(trail['position'], ()):
                         if snake.alive and snake.id != trail['created_by']:
-                            if snake.body and snake.body[0] == trail['position']:
-                                if not snake.has_power_up(PowerUpType.INVINCIBILITY) and not snake.has_power_up(PowerUpType.GHOST):
-                                    # Snake hit acid, eliminate it
-                                    snake.alive = False
-                                    
-                                    # Record death order for scoring
-                                    snake.death_order = self.death_counter
-                                    self.death_counter += 1
-                                    
-                                    # Drop snake as food after recording death
-                                    self.drop_snake_as_food(snake)
+                            if not snake.has_power_up(PowerUpType.INVINCIBILITY) and not snake.has_power_up(PowerUpType.GHOST):
+                                # Snake hit acid, eliminate it
+                                snake.alive = False
+                                
+                                # Record death order for scoring
+                                snake.death_order = self.death_counter
+                                self.death_counter += 1
+                                
+                                # Drop snake as food after recording death
+                                self.drop_snake_as_food(snake)
             
             # Update the acid trails list
             self.acid_trails = active_trails
             
         # Create bonus food if enough time has passed
-        if (len([f for f in self.foods if f.type == FoodType.BONUS]) == 0 and 
-                time.time() - self.last_food_time > Config.FOOD_BONUS_DURATION):
+        if (now - self.last_food_time > Config.FOOD_BONUS_DURATION and
+                not any(f.type is FoodType.BONUS for f in self.foods)):
             self.create_food(FoodType.BONUS)
         
         # Randomly create power-ups
         if random.random() < Config.POWER_UP_CHANCE:
             self.create_power_up()
         
-        # Update current leader for ENFORCER strategy
-        self.update_current_leader()
-        
-        # Move each snake and check collisions
-        for snake in self.snakes:
+        # Update current leader for ENFORCER strategy. Score gains keep it current
+        # (see handle_food_eaten), so a full rescan is only needed once it dies
+        leader = self.current_leader
+        if leader is None or not leader.alive:
+            self.update_current_leader()
+        
+        # Move each snake and check collisions. Snakes decide and move one after
+        # another, each seeing the moves made before it this tick, so AI decisions
+        # are deliberately not batched up front
+        self.ai_deadline = time.time() + Config.AI_TICK_BUDGET
+        snakes = self.snakes
+        right_wall, bottom_wall = self.width - 1, self.height - 1
+        debug_integrity = Config.DEBUG_INTEGRITY
+        for snake in snakes:
             if not snake.alive:
                 continue
                 
@@ -2489,11 +2766,11 @@ class GameState:
             if snake.is_frozen():
                 continue
             
-            # Gather positions of other snakes
-            other_positions = set()
-            for other in self.snakes:
-                if other is not snake and other.alive:
-                    other_positions.update(other.body_set)
+            # Gather positions of other snakes. This is rebuilt for every snake because
+            # the snakes before it have already moved this tick (and ghosts can share
+            # cells), so a single occupancy snapshot per frame would go stale
+            other_positions = set().union(*[other.body_set for other in snakes
+                                            if other is not snake and other.alive])
             
             # Move the snake
             new_head = snake.move(self.foods + self.temp_foods, other_positions, self.power_ups, self)
@@ -2502,17 +2779,18 @@ class GameState:
             if new_head is None:
                 continue
             
-            # Check for power-ups
-            has_invincibility = snake.has_power_up(PowerUpType.INVINCIBILITY)
-            has_ghost = snake.has_power_up(PowerUpType.GHOST)
-            has_teleport = snake.has_power_up(PowerUpType.TELEPORT)
+            # Check for power-ups (read straight from the active power-up dict;
+            # teleport only matters after hitting a wall, so it is checked there)
+            active_power_ups = snake.power_ups
+            has_invincibility = PowerUpType.INVINCIBILITY in active_power_ups
+            phasing = has_invincibility or PowerUpType.GHOST in active_power_ups
             
             # Check wall collision (handling teleport and invincibility)
-            hit_wall = (new_head[0] <= 0 or new_head[0] >= self.width - 1 or 
-                      new_head[1] <= 0 or new_head[1] >= self.height - 1)
+            hit_wall = (new_head[0] <= 0 or new_head[0] >= right_wall or 
+                      new_head[1] <= 0 or new_head[1] >= bottom_wall)
             
             if hit_wall:
-                if has_teleport:
+                if PowerUpType.TELEPORT in active_power_ups:
                     # Teleport to the opposite side
                     if new_head[0] <= 0:
                         new_head = (self.width - 2, new_head[1])
@@ -2539,23 +2817,25 @@ class GameState:
                 continue  # Snake has been handled (killed or teleported)
             
             # Check snake collision (unless ghost or invincible)
-            hit_self = new_head in snake.body[1:]
+            hit_self = new_head in islice(snake.body, 1, None)
             hit_other = new_head in other_positions
             
-            if (hit_self and not has_invincibility) or (hit_other and not (has_ghost or has_invincibility)):
+            if (hit_self and not has_invincibility) or (hit_other and not phasing):
                 if self.kill_snake(snake):
                     continue
             
-            # Check for eating food
+            # Check for eating food (the lists change when a food is eaten, but the
+            # loop stops right there, so they can be walked without copying)
             ate_food = False
-            for food in self.foods + self.temp_foods:
+            for food in chain(self.foods, self.temp_foods):
                 if new_head == food.position:
                     ate_food = True
                     self.handle_food_eaten(snake, food)
                     break
             
-            # Check for power-up collection
-            for power_up in list(self.power_ups):
+            # Check for power-up collection (collecting one changes the list, but the
+            # loop stops right after, so there is no need to walk a copy)
+            for power_up in self.power_ups:
                 if new_head == power_up.position:
                     self.handle_power_up_collected(snake, power_up)
                     break
@@ -2565,7 +2845,7 @@ class GameState:
                 snake.remove_tail()
             
             # Validate snake integrity after all modifications
-            if Config.DEBUG_INTEGRITY and snake.alive:
+            if debug_integrity and snake.alive:
                 try:
                     snake.validate_body_integrity()
                 except ValueError as e:
@@ -2598,29 +2878,25 @@ class GameState:
         
         Returns: True if the snake hit a deadly obstacle, False otherwise.
         """
-        for obstacle in self.obstacles:
-            if head_pos == obstacle.position:
-                effect = obstacle.get_effect()
-                
-                # Handle deadly obstacles
-                if effect.get("deadly", False) and not snake.has_power_up(PowerUpType.INVINCIBILITY):
-                    self.kill_snake(snake)
-                    return True
-                
-                # Note: Teleport is now handled in Snake.move() BEFORE head insertion
-                # This prevents phantom positions from being added
-                
-                # Handle speed effects (swamp, energy field)
-                if "speed_multiplier" in effect:
-                    multiplier = effect["speed_multiplier"]
-                    if multiplier < 1.0:  # Slowing effect (swamp)
-                        # Apply temporary slowing effect but don't override existing speed boost
-                        if not snake.has_power_up(PowerUpType.SPEED_BOOST) and not snake.has_power_up(PowerUpType.WARP_DRIVE):
-                            snake.add_power_up(PowerUpType.SPEED_BOOST)  # Override with slowing
-                    elif multiplier > 1.0:  # Speeding effect (energy field)
-                        # Apply temporary speed boost but don't override warp drive
-                        if not snake.has_power_up(PowerUpType.SPEED_BOOST) and not snake.has_power_up(PowerUpType.WARP_DRIVE):
-                            snake.add_power_up(PowerUpType.SPEED_BOOST)
+        for obstacle in self.obstacles_at.get(head_pos, ()):
+            effect = obstacle.get_effect()
+            
+            # Handle deadly obstacles
+            if effect.get("deadly", False) and not snake.has_power_up(PowerUpType.INVINCIBILITY):
+                self.kill_snake(snake)
+                return True
+            
+            # Note: Teleport is now handled in Snake.move() BEFORE head insertion
+            # This prevents phantom positions from being added
+            
+            # Handle speed effects. Slowing (swamp) and speeding (energy field) both
+            # apply a temporary speed boost, but never override an existing speed
+            # boost or warp drive
+            multiplier = effect.get("speed_multiplier")
+            if multiplier is not None and multiplier != 1.0:
+                active_power_ups = snake.power_ups
+                if PowerUpType.SPEED_BOOST not in active_power_ups and PowerUpType.WARP_DRIVE not in active_power_ups:
+                    snake.add_power_up(PowerUpType.SPEED_BOOST)
                 
         return False
         
@@ -2636,28 +2912,29 @@ class GameState:
             self.current_leader = None
             return
             
-        leader = max(alive_snakes, key=lambda s: s.score)
+        leader = max(alive_snakes, key=attrgetter("score"))
         self.current_leader = leader
     
     def kill_snake(self, snake):
         """Handle snake death"""
+        power_ups = snake.power_ups
+        
         # Check if snake has shield
-        if snake.has_shield():
+        if PowerUpType.SHIELD in power_ups:
             # Shield absorbs one fatal hit, then is removed
-            if PowerUpType.SHIELD in snake.power_ups:
-                del snake.power_ups[PowerUpType.SHIELD]
+            del power_ups[PowerUpType.SHIELD]
             return False  # Snake survived
             
         # Check if snake has time warp
-        if snake.has_time_warp() and len(snake.body) > 3:
-            # Instead of dying, teleport back to third segment
-            safe_pos = snake.body[2] 
-            snake.body = [safe_pos] + snake.body[3:]
-            snake.body_set = set(snake.body)
+        if PowerUpType.TIME_WARP in power_ups and len(snake.body) > 3:
+            # Instead of dying, teleport back to third segment: drop the first two
+            # segments in place and forget them unless the body still crosses them
+            body = snake.body
+            removed = (body.popleft(), body.popleft())
+            snake.body_set.difference_update([pos for pos in removed if pos not in body])
             
             # Remove the time warp power-up
-            if PowerUpType.TIME_WARP in snake.power_ups:
-                del snake.power_ups[PowerUpType.TIME_WARP]
+            del power_ups[PowerUpType.TIME_WARP]
             
             return False  # Snake survived
         
@@ -2670,18 +2947,15 @@ class GameState:
         body_copy = list(snake.body)
         
         # Clear the snake's body data structures to avoid any issues
-        snake.body = []
+        snake.body = deque()
         snake.body_set.clear()
         
         # Now convert the saved body to food
-        for pos in body_copy:
-            self.temp_foods.append(Food(
-                position=pos,
-                type=FoodType.DROPPED,
-                points=Config.TEMP_FOOD_POINTS,
-                char=":",
-                color=6
-            ))
+        points = Config.TEMP_FOOD_POINTS
+        self.temp_foods.extend(
+            Food(position=pos, type=FoodType.DROPPED, points=points, char=":", color=6)
+            for pos in body_copy
+        )
             
         return True  # Snake died
     
@@ -2694,16 +2968,28 @@ class GameState:
         
         snake.score += base_points
         
+        # Take the lead if that put this snake ahead (on a tie the snake listed
+        # first leads, as in update_current_leader)
+        leader = self.current_leader
+        if (leader is not None and leader.alive and snake is not leader and
+                (snake.score > leader.score or
+                 (snake.score == leader.score and self.snakes.index(snake) < self.snakes.index(leader)))):
+            self.current_leader = snake
+        
         # Make the snake longer
         snake.gets_longer(food.type)
         
-        # Remove the food
-        if food in self.foods:
+        # Remove the food (remove() does the membership test, so each list is walked once)
+        try:
             self.foods.remove(food)
+        except ValueError:
+            try:
+                self.temp_foods.remove(food)
+            except ValueError:
+                pass
+        else:
             # Create a new food if normal/bonus food was eaten
             self.create_food()
-        elif food in self.temp_foods:
-            self.temp_foods.remove(food)
         
         # Reset food eaten time
         self.last_food_eaten = time.time()
@@ -2721,63 +3007,73 @@ class GameState:
         self.special_event_timer = 50  # Event duration in frames
         
         # Choose a random event
-        event_type = random.randint(1, 5)
+        random.choice(self._SPECIAL_EVENTS)(self)
         
-        if event_type == 1:
-            # Power-up rain - spawn multiple power-ups
-            for _ in range(random.randint(3, 6)):
-                # Create power-ups in safe locations
-                attempts = 0
-                while attempts < 20:
-                    valid_position = self.create_power_up()
-                    if valid_position:
-                        break
-                    attempts += 1
+    def _event_power_up_rain(self):
+        """Power-up rain - spawn multiple power-ups"""
+        all_positions = self._power_up_blocked_positions()
+        for _ in range(random.randint(3, 6)):
+            # Create power-ups in safe locations
+            attempts = 0
+            while attempts < 20:
+                valid_position = self.create_power_up(all_positions)
+                if valid_position:
+                    break
+                attempts += 1
                 
-        elif event_type == 2:
-            # Food frenzy - spawn lots of bonus food
-            for _ in range(random.randint(5, 10)):
-                # Create food in safe locations
-                attempts = 0
-                while attempts < 20:
-                    valid_position = self.create_food(FoodType.BONUS)
-                    if valid_position:
-                        break
-                    attempts += 1
+    def _event_food_frenzy(self):
+        """Food frenzy - spawn lots of bonus food"""
+        all_positions = self._food_blocked_positions()
+        for _ in range(random.randint(5, 10)):
+            # Create food in safe locations
+            attempts = 0
+            while attempts < 20:
+                valid_position = self.create_food(FoodType.BONUS, all_positions)
+                if valid_position:
+                    break
+                attempts += 1
                 
-        elif event_type == 3:
-            # Speed burst - temporarily increase game speed
-            self.speed_multiplier *= 1.5
+    def _event_speed_burst(self):
+        """Speed burst - temporarily increase game speed"""
+        self.speed_multiplier *= 1.5
             
-        elif event_type == 4:
-            # Snake swap - randomize AI strategies
-            for snake in self.snakes:
-                if not snake.is_human and snake.alive:
-                    # Change to a random strategy
-                    snake.strategy = random.choice(list(AIStrategy))
+    def _event_snake_swap(self):
+        """Snake swap - randomize AI strategies"""
+        for snake in self.snakes:
+            if not snake.is_human and snake.alive:
+                # Change to a random strategy
+                snake.strategy = random.choice(list(AIStrategy))
                     
-        elif event_type == 5:
-            # Obstacle shift - remove and recreate obstacles
-            if Config.OBSTACLE_ENABLED:
-                # Save snake positions to avoid placing obstacles on them
-                snake_positions = set()
-                for snake in self.snakes:
-                    if snake.alive:
-                        snake_positions.update(snake.body)
-                
-                # Clear obstacles
-                self.obstacles = []
-                
-                # Recreate obstacles, avoiding snake positions
-                attempts = 0
-                obstacles_created = 0
-                max_attempts = 50
-                
-                while obstacles_created < Config.OBSTACLE_COUNT and attempts < max_attempts:
-                    # Create obstacles in safe locations
-                    if self.create_obstacles(snake_positions):
-                        obstacles_created += 1
-                    attempts += 1
+    def _event_obstacle_shift(self):
+        """Obstacle shift - remove and recreate obstacles"""
+        if Config.OBSTACLE_ENABLED:
+            # Save snake positions to avoid placing obstacles on them
+            snake_positions = set().union(*[snake.body_set for snake in self.snakes if snake.alive])
+            
+            # Clear obstacles
+            self.clear_obstacles()
+            
+            # Recreate obstacles, avoiding snake positions
+            attempts = 0
+            obstacles_created = 0
+            max_attempts = 50
+            
+            while obstacles_created < Config.OBSTACLE_COUNT and attempts < max_attempts:
+                # Create obstacles in safe locations
+                if self.create_obstacles(snake_positions):
+                    obstacles_created += 1
+                attempts += 1
+
+    # Special event handlers, picked with a single random.choice in
+    # trigger_special_event. The order matches the old randint(1, 5) numbering,
+    # so the same draw selects the same event
+    _SPECIAL_EVENTS = (
+        _event_power_up_rain,
+        _event_food_frenzy,
+        _event_speed_burst,
+        _event_snake_swap,
+        _event_obstacle_shift,
+    )
                 
     def update_special_event(self):
         """Update special event state"""
@@ -2810,9 +3106,9 @@ class GameState:
         if not any(snake.alive for snake in self.snakes):
             self.game_over = True
     
-    def update_game_speed(self):
-        """Update game speed based on time and events"""
-        current_time = time.time()
+    def update_game_speed(self, now=None):
+        """Update game speed based on time and events (`now` defaults to the current time)"""
+        current_time = time.time() if now is None else now
         
         # Increase speed over time
         if current_time - self.last_speed_increase > Config.SPEED_INCREASE_INTERVAL:
@@ -2821,11 +3117,13 @@ class GameState:
             self.last_speed_increase = current_time
         
         # Speed up if no food has been eaten for a while
-        if current_time - self.last_food_eaten > Config.MAX_IDLE_TIME:
-            idle_factor = min(2.0, 1.0 + ((current_time - self.last_food_eaten) / Config.MAX_IDLE_TIME))
+        max_idle = Config.MAX_IDLE_TIME
+        idle_time = current_time - self.last_food_eaten
+        if idle_time > max_idle:
+            idle_factor = min(2.0, 1.0 + (idle_time / max_idle))
             self.speed_multiplier = min(Config.MAX_SPEED_MULTIPLIER, self.speed_multiplier * idle_factor)
             # Reset the timer to avoid compounding speed
-            self.last_food_eaten = current_time - Config.MAX_IDLE_TIME
+            self.last_food_eaten = current_time - max_idle
         
         # Calculate effective speed (lower number = faster game)
         self.game_speed = Config.BASE_SPEED / self.speed_multiplier
@@ -2835,6 +3133,118 @@ class GameState:
 # UI RENDERER CLASS
 # =============================================================================
 
+# Status-bar letters for the human player's active power-ups
+POWER_UP_LETTERS = {
+    PowerUpType.SPEED_BOOST: "S",
+    PowerUpType.INVINCIBILITY: "I",
+    PowerUpType.GHOST: "G",
+    PowerUpType.GROWTH: "+",
+    PowerUpType.SCORE_MULTIPLIER: "M",
+    PowerUpType.SHRINK: "-",
+    PowerUpType.MAGNETIC: "Ω",
+    PowerUpType.FREEZE: "F",
+    PowerUpType.TELEPORT: "T",
+    PowerUpType.VISION: "V",
+    PowerUpType.CONFUSION: "C",
+    PowerUpType.REVERSE: "R",
+    PowerUpType.WARP_DRIVE: "W",
+}
+
+# Icons appended to a snake's score line (standard scoreboard)
+POWER_UP_SCORE_ICONS = {
+    PowerUpType.SPEED_BOOST: "⚡",
+    PowerUpType.INVINCIBILITY: "★",
+    PowerUpType.GHOST: "👻",
+    PowerUpType.GROWTH: "↑",
+    PowerUpType.SCORE_MULTIPLIER: "×2",
+}
+
+# Marks appended to a snake's score in the compact scoreboard
+POWER_UP_COMPACT_MARKS = {
+    PowerUpType.INVINCIBILITY: "*",
+    PowerUpType.GHOST: "g",
+}
+
+
+@lru_cache(maxsize=256)
+def snake_glyphs(power_up_types):
+    """Head char, body char and attributes for a snake with the given power-ups.
+    
+    Depends only on the (frozen) set of active power-up types, so draw_board
+    looks it up once per snake instead of re-testing each power-up every frame.
+    """
+    head_char = 'H'
+    body_char = 'o'
+    attrs = 0
+    
+    if power_up_types:
+        attrs |= curses.A_BOLD
+        
+        # Invincibility effect
+        if PowerUpType.INVINCIBILITY in power_up_types:
+            attrs |= curses.A_BLINK
+            head_char = '@'
+        
+        # Ghost effect
+        if PowerUpType.GHOST in power_up_types:
+            body_char = '░'
+            
+        # Speed boost effect
+        if PowerUpType.SPEED_BOOST in power_up_types:
+            head_char = '>'
+        
+        # Warp drive effect
+        if PowerUpType.WARP_DRIVE in power_up_types:
+            head_char = '⚡'
+            body_char = '~'
+        
+        # Magnetic effect
+        if PowerUpType.MAGNETIC in power_up_types:
+            head_char = 'Ω'
+        
+        # Shrink effect
+        if PowerUpType.SHRINK in power_up_types:
+            body_char = '.'
+        
+        # Vision effect
+        if PowerUpType.VISION in power_up_types:
+            head_char = 'V'
+        
+        # Teleport effect
+        if PowerUpType.TELEPORT in power_up_types:
+            head_char = 'T'
+        
+        # Freeze effect - unlikely but possible if snake collected it and then got frozen
+        if PowerUpType.FREEZE in power_up_types:
+            attrs |= curses.A_DIM
+            head_char = 'F'
+        
+        # Confusion effect
+        if PowerUpType.CONFUSION in power_up_types:
+            head_char = '?'
+        
+        # Reverse effect
+        if PowerUpType.REVERSE in power_up_types:
+            head_char = 'R'
+    
+    return head_char, body_char, attrs
+
+
+# Snake decoration drawn under the title
+SNAKE_ART = (
+    "    _________         _________",
+    "   /         \\       /         \\",
+    "  /  /~~~~~~~\\\\     /  /~~~~~~~\\\\",
+    " /  /        _\\\\   /  /        _\\\\",
+    "|  |        /  || |  |        /  ||",
+    "|  |       |   || |  |       |   ||",
+    "|  |       |   || |  |       |   ||",
+    " \\  \\      |  //   \\  \\      |  //",
+    "  \\  ~~~~~  //     \\  ~~~~~  //",
+    "   \\_______//       \\_______//",
+)
+
+
 class Renderer:
     """Handles all rendering operations"""
     
@@ -2871,9 +3281,20 @@ class Renderer:
         curses.init_pair(18, curses.COLOR_YELLOW, curses.COLOR_BLACK)  # Snake16
         curses.init_pair(19, curses.COLOR_MAGENTA, curses.COLOR_BLACK) # Snake17
         curses.init_pair(20, curses.COLOR_CYAN, curses.COLOR_BLACK)    # Snake18
+        
+        # Attribute value of every pair above, indexed by pair number
+        self._color_pairs = tuple(curses.color_pair(i) for i in range(21))
+        
+        # Snake colors depend only on the id, so resolve them once here
+        self._snake_colors = [self._compute_snake_color(snake_id)
+                              for snake_id in range(Config.MAX_SNAKES + 1)]
+        
+        # Title-screen art lines paired with their color
+        self._snake_art = [(line, self._color_pairs[i % 5 + 1]) for i, line in enumerate(SNAKE_ART)]
     
-    def get_snake_color(self, snake_id):
-        """Get color for a snake with attributes for variety"""
+    @staticmethod
+    def _compute_snake_color(snake_id):
+        """Color pair and attributes for a snake id"""
         # Use modulo to cycle through color pairs
         color_pair = (snake_id % 7) + 1
         
@@ -2886,6 +3307,10 @@ class Renderer:
             
         return curses.color_pair(color_pair) | attrs
     
+    def get_snake_color(self, snake_id):
+        """Get color for a snake with attributes for variety"""
+        return self._snake_colors[snake_id]
+    
     def safe_addch(self, y, x, ch, attr=0):
         """Safely add a character to the screen"""
         try:
@@ -2902,45 +3327,54 @@ class Renderer:
     
     def draw_board(self, game_state):
         """Draw the game board with all elements"""
-        self.stdscr.clear()
+        # erase() only blanks the window; unlike clear() it does not force a full
+        # terminal repaint, so refresh() sends just the cells that changed
+        self.stdscr.erase()
         
         # Draw border with enhanced visuals
+        # (horizontal edges go out as one string each; vertical ones stay per cell)
         if Config.ENHANCED_VISUALS:
             border_style = self.get_border_style(game_state)
-            for x in range(game_state.width):
-                self.safe_addch(1, x, border_style['horizontal'], border_style['color'] | border_style['attr'])
-                self.safe_addch(game_state.height, x, border_style['horizontal'], border_style['color'] | border_style['attr'])
+            border_attr = border_style['color'] | border_style['attr']
+            horizontal = border_style['horizontal'] * game_state.width
+            self.safe_addstr(1, 0, horizontal, border_attr)
+            self.safe_addstr(game_state.height, 0, horizontal, border_attr)
             for y in range(1, game_state.height + 1):
-                self.safe_addch(y, 0, border_style['vertical'], border_style['color'] | border_style['attr'])
-                self.safe_addch(y, game_state.width-1, border_style['vertical'], border_style['color'] | border_style['attr'])
+                self.safe_addch(y, 0, border_style['vertical'], border_attr)
+                self.safe_addch(y, game_state.width-1, border_style['vertical'], border_attr)
             
             # Draw corners
-            self.safe_addch(1, 0, border_style['top_left'], border_style['color'] | border_style['attr'])
-            self.safe_addch(1, game_state.width-1, border_style['top_right'], border_style['color'] | border_style['attr'])
-            self.safe_addch(game_state.height, 0, border_style['bottom_left'], border_style['color'] | border_style['attr'])
-            self.safe_addch(game_state.height, game_state.width-1, border_style['bottom_right'], border_style['color'] | border_style['attr'])
+            self.safe_addch(1, 0, border_style['top_left'], border_attr)
+            self.safe_addch(1, game_state.width-1, border_style['top_right'], border_attr)
+            self.safe_addch(game_state.height, 0, border_style['bottom_left'], border_attr)
+            self.safe_addch(game_state.height, game_state.width-1, border_style['bottom_right'], border_attr)
         else:
             # Traditional border
-            border_color = curses.color_pair(0)
-            for x in range(game_state.width):
-                self.safe_addch(1, x, '#', border_color)
-                self.safe_addch(game_state.height, x, '#', border_color)
+            border_color = self._color_pairs[0]
+            horizontal = '#' * game_state.width
+            self.safe_addstr(1, 0, horizontal, border_color)
+            self.safe_addstr(game_state.height, 0, horizontal, border_color)
             for y in range(1, game_state.height + 1):
                 self.safe_addch(y, 0, '#', border_color)
                 self.safe_addch(y, game_state.width-1, '#', border_color)
         
+        # Animation phases shared by every object drawn this frame
+        frame_count = game_state.frame_count
+        blink_phase = frame_count % 10 < 5    # wormholes, bonus food, rare power-ups
+        flicker_phase = frame_count % 6 < 3   # energy fields, temporary food
+        
         # Draw obstacles
         for obstacle in game_state.obstacles:
-            obstacle_color = curses.color_pair(obstacle.color)
+            obstacle_color = self._color_pairs[obstacle.color]
             attrs = 0
             
             # Add visual effects for certain obstacle types
             if obstacle.type == ObstacleType.WORMHOLE:
                 attrs |= curses.A_BOLD
-                if game_state.frame_count % 10 < 5:  # Animation effect
+                if blink_phase:  # Animation effect
                     attrs |= curses.A_BLINK
             elif obstacle.type == ObstacleType.ENERGY_FIELD:
-                if game_state.frame_count % 6 < 3:  # Alternate characters for animation
+                if flicker_phase:  # Alternate characters for animation
                     self.safe_addch(obstacle.position[1] + 1, obstacle.position[0], "≡", obstacle_color | attrs)
                 else:
                     self.safe_addch(obstacle.position[1] + 1, obstacle.position[0], "≣", obstacle_color | attrs)
@@ -2950,12 +3384,12 @@ class Renderer:
         
         # Draw food
         for food in game_state.foods:
-            food_color = curses.color_pair(food.color)
+            food_color = self._color_pairs[food.color]
             attributes = curses.A_BLINK if food.type == FoodType.BONUS else 0
             
             # Enhance visuals for bonus food
             if Config.ENHANCED_VISUALS and food.type == FoodType.BONUS:
-                if game_state.frame_count % 10 < 5:
+                if blink_phase:
                     self.safe_addch(food.position[1] + 1, food.position[0], "★", food_color | curses.A_BOLD)
                 else:
                     self.safe_addch(food.position[1] + 1, food.position[0], "☆", food_color | curses.A_BOLD)
@@ -2964,23 +3398,23 @@ class Renderer:
         
         # Draw temporary foods
         for food in game_state.temp_foods:
-            temp_color = curses.color_pair(food.color)
+            temp_color = self._color_pairs[food.color]
             # Special animation for temporary food if enhanced visuals are enabled
-            if Config.ENHANCED_VISUALS and game_state.frame_count % 6 < 3:
+            if Config.ENHANCED_VISUALS and flicker_phase:
                 self.safe_addch(food.position[1] + 1, food.position[0], "·", temp_color | curses.A_DIM)
             else:
                 self.safe_addch(food.position[1] + 1, food.position[0], food.char, temp_color)
         
         # Draw power-ups with enhanced visuals
         for power_up in game_state.power_ups:
-            power_up_color = curses.color_pair(power_up.color)
+            power_up_color = self._color_pairs[power_up.color]
             
             # Get additional attributes for this power-up
             if Config.ENHANCED_VISUALS:
                 attrs = power_up.get_display_attributes(game_state)
                 
                 # Special animation for rare power-ups
-                if power_up.rarity == "rare" and game_state.frame_count % 10 < 5:
+                if power_up.rarity == "rare" and blink_phase:
                     char = "✧" if power_up.char == "✦" else "✦"
                     self.safe_addch(power_up.position[1] + 1, power_up.position[0], char, 
                                  power_up_color | attrs)
@@ -2992,87 +3426,41 @@ class Renderer:
                            power_up_color | attrs)
         
         # Draw snakes
+        addch = self.stdscr.addch
         for snake in game_state.snakes:
             if not snake.alive:
                 continue
             
             snake_color = self.get_snake_color(snake.id)
             
-            # Add special attributes for power-ups
-            attrs = 0
-            head_char = 'H'
-            body_char = 'o'
-            
             # Apply power-up visual effects
             if snake.power_ups:
-                attrs |= curses.A_BOLD
-                
-                # Invincibility effect
-                if snake.has_power_up(PowerUpType.INVINCIBILITY):
-                    attrs |= curses.A_BLINK
-                    head_char = '@'
-                
-                # Ghost effect    
-                if snake.has_power_up(PowerUpType.GHOST):
-                    body_char = '░'
-                    
-                # Speed boost effect
-                if snake.has_power_up(PowerUpType.SPEED_BOOST):
-                    head_char = '>'
-                
-                # Warp drive effect
-                if snake.has_power_up(PowerUpType.WARP_DRIVE):
-                    head_char = '⚡'
-                    body_char = '~'
-                
-                # Magnetic effect
-                if snake.has_power_up(PowerUpType.MAGNETIC):
-                    head_char = 'Ω'
-                
-                # Shrink effect
-                if snake.has_power_up(PowerUpType.SHRINK):
-                    body_char = '.'
-                
-                # Vision effect
-                if snake.has_power_up(PowerUpType.VISION):
-                    head_char = 'V'
-                
-                # Teleport effect
-                if snake.has_power_up(PowerUpType.TELEPORT):
-                    head_char = 'T'
-                
-                # Freeze effect - unlikely but possible if snake collected it and then got frozen
-                if snake.is_frozen():
-                    attrs |= curses.A_DIM
-                    head_char = 'F'
-                
-                # Confusion effect
-                if snake.has_power_up(PowerUpType.CONFUSION):
-                    head_char = '?'
-                
-                # Reverse effect
-                if snake.has_power_up(PowerUpType.REVERSE):
-                    head_char = 'R'
+                head_char, body_char, attrs = snake_glyphs(frozenset(snake.power_ups))
+            else:
+                head_char, body_char, attrs = 'H', 'o', 0
             
             # Special effect for the leader snake
-            if snake == game_state.current_leader and Config.ENHANCED_VISUALS:
+            is_leader = snake == game_state.current_leader and Config.ENHANCED_VISUALS
+            if is_leader:
                 attrs |= curses.A_BOLD
-                # Cycle colors for the leader's head
-                if Config.COLOR_CYCLING:
-                    cycle_color = (game_state.frame_count // 5) % 7 + 1
-                    leader_color = curses.color_pair(cycle_color) | attrs
-                    self.safe_addch(snake.body[0][1] + 1, snake.body[0][0], '★', leader_color)
-                    
-                    # Draw rest of body
-                    for i, cell in enumerate(snake.body[1:], 1):
-                        self.safe_addch(cell[1] + 1, cell[0], body_char, snake_color | attrs)
-                    
-                    continue  # Skip normal snake drawing
-            
-            # Draw each segment
-            for i, cell in enumerate(snake.body):
-                char = head_char if i == 0 else body_char
-                self.safe_addch(cell[1] + 1, cell[0], char, snake_color | attrs)
+            segment_attr = snake_color | attrs
+            head_attr = segment_attr
+            
+            # Cycle colors for the leader's head
+            if is_leader and Config.COLOR_CYCLING:
+                cycle_color = (frame_count // 5) % 7 + 1
+                head_char = '★'
+                head_attr = self._color_pairs[cycle_color] | attrs
+            
+            # Draw the head, then the body segments in one tight loop (the
+            # per-cell safe_addch call is inlined here since bodies are long)
+            head_x, head_y = snake.body[0]
+            self.safe_addch(head_y + 1, head_x, head_char, head_attr)
+            for x, y in islice(snake.body, 1, None):
+                try:
+                    addch(y + 1, x, body_char, segment_attr)
+                except curses.error:
+                    pass
         
         # Draw status bar
         self.draw_status_bar(game_state)
@@ -3080,10 +3468,10 @@ class Renderer:
         # Draw help text with enhanced visuals
         if Config.ENHANCED_VISUALS:
             help_text = "P: Pause | Q: Quit | Arrow Keys: Move | Space: Special Event"
-            help_color = curses.color_pair(6) | curses.A_BOLD
+            help_color = self._color_pairs[6] | curses.A_BOLD
         else:
             help_text = "P: Pause | Q: Quit | Arrow Keys: Move"
-            help_color = curses.color_pair(6)
+            help_color = self._color_pairs[6]
             
         self.safe_addstr(game_state.height + 1, 1, help_text, help_color)
         
@@ -3096,13 +3484,16 @@ class Renderer:
                 start_x = (game_state.width - pause_box_width) // 2
                 start_y = (game_state.height - pause_box_height) // 2
                 
-                # Draw box
-                for y in range(pause_box_height):
-                    for x in range(pause_box_width):
-                        if (y == 0 or y == pause_box_height - 1) or (x == 0 or x == pause_box_width - 1):
-                            self.safe_addch(start_y + y, start_x + x, '█', curses.color_pair(7))
-                        else:
-                            self.safe_addch(start_y + y, start_x + x, ' ', curses.A_REVERSE)
+                # Draw box, a row at a time
+                box_color = self._color_pairs[7]
+                box_edge = '█' * pause_box_width
+                box_fill = ' ' * (pause_box_width - 2)
+                self.safe_addstr(start_y, start_x, box_edge, box_color)
+                for y in range(1, pause_box_height - 1):
+                    self.safe_addch(start_y + y, start_x, '█', box_color)
+                    self.safe_addstr(start_y + y, start_x + 1, box_fill, curses.A_REVERSE)
+                    self.safe_addch(start_y + y, start_x + pause_box_width - 1, '█', box_color)
+                self.safe_addstr(start_y + pause_box_height - 1, start_x, box_edge, box_color)
                 
                 # Draw text
                 pause_text = "GAME PAUSED"
@@ -3130,14 +3521,14 @@ class Renderer:
             'top_right': '╗',
             'bottom_left': '╚',
             'bottom_right': '╝',
-            'color': curses.color_pair(7),
+            'color': self._color_pairs[7],
             'attr': curses.A_NORMAL
         }
         
         # Change color based on frame count if color cycling is enabled
         if Config.COLOR_CYCLING:
             cycle_color = (game_state.frame_count // 20) % 7 + 1
-            style['color'] = curses.color_pair(cycle_color)
+            style['color'] = self._color_pairs[cycle_color]
         
         # Add special effects based on game state
         if game_state.special_event_active:
@@ -3164,14 +3555,14 @@ class Renderer:
         # Draw status bar background with enhanced visuals
         if Config.ENHANCED_VISUALS:
             # Use a gradient or special color for status bar
-            status_color = curses.color_pair(7) | curses.A_BOLD
+            status_color = self._color_pairs[7] | curses.A_BOLD
             
             # Draw status bar border
             for x in range(game_state.width):
                 self.safe_addch(0, x, '▁', status_color)
         else:
             # Traditional status bar
-            status_color = curses.color_pair(0)
+            status_color = self._color_pairs[0]
             for x in range(game_state.width):
                 self.safe_addch(0, x, ' ', status_color)
         
@@ -3186,40 +3577,13 @@ class Renderer:
             human_snake = next((s for s in game_state.snakes if s.is_human and s.alive), None)
             if human_snake and human_snake.power_ups:
                 powerup_text = "Active Power-ups: "
-                powerup_indicators = []
-                
-                for power_up_type in human_snake.power_ups:
-                    if power_up_type == PowerUpType.SPEED_BOOST:
-                        powerup_indicators.append("S")
-                    elif power_up_type == PowerUpType.INVINCIBILITY:
-                        powerup_indicators.append("I")
-                    elif power_up_type == PowerUpType.GHOST:
-                        powerup_indicators.append("G")
-                    elif power_up_type == PowerUpType.GROWTH:
-                        powerup_indicators.append("+")
-                    elif power_up_type == PowerUpType.SCORE_MULTIPLIER:
-                        powerup_indicators.append("M")
-                    elif power_up_type == PowerUpType.SHRINK:
-                        powerup_indicators.append("-")
-                    elif power_up_type == PowerUpType.MAGNETIC:
-                        powerup_indicators.append("Ω")
-                    elif power_up_type == PowerUpType.FREEZE:
-                        powerup_indicators.append("F")
-                    elif power_up_type == PowerUpType.TELEPORT:
-                        powerup_indicators.append("T")
-                    elif power_up_type == PowerUpType.VISION:
-                        powerup_indicators.append("V")
-                    elif power_up_type == PowerUpType.CONFUSION:
-                        powerup_indicators.append("C")
-                    elif power_up_type == PowerUpType.REVERSE:
-                        powerup_indicators.append("R")
-                    elif power_up_type == PowerUpType.WARP_DRIVE:
-                        powerup_indicators.append("W")
+                powerup_indicators = [POWER_UP_LETTERS[p] for p in human_snake.power_ups
+                                      if p in POWER_UP_LETTERS]
                 
                 # Draw power-up indicators
                 if powerup_indicators:
                     powerup_text += ", ".join(powerup_indicators)
-                    powerup_color = curses.color_pair(5) | curses.A_BOLD
+                    powerup_color = self._color_pairs[5] | curses.A_BOLD
                     
                     # Calculate where to place the text (centered below the status bar)
                     y_pos = game_state.height + 2  # Below the help text
@@ -3232,7 +3596,7 @@ class Renderer:
         if len(game_state.snakes) <= 6:
             # Standard display for few snakes
             y_pos = 2
-            for snake in sorted(game_state.snakes, key=lambda s: s.score, reverse=True):
+            for snake in sorted(game_state.snakes, key=attrgetter("score"), reverse=True):
                 if not snake.alive:
                     continue
                 
@@ -3242,14 +3606,7 @@ class Renderer:
                 snake_type = "Human" if snake.is_human else f"AI-{snake.strategy.name}"
                 power_ups = ""
                 if snake.power_ups:
-                    power_up_chars = {
-                        PowerUpType.SPEED_BOOST: "⚡",
-                        PowerUpType.INVINCIBILITY: "★",
-                        PowerUpType.GHOST: "👻",
-                        PowerUpType.GROWTH: "↑",
-                        PowerUpType.SCORE_MULTIPLIER: "×2"
-                    }
-                    power_ups = " " + "".join(power_up_chars.get(p, "") for p in snake.power_ups)
+                    power_ups = " " + "".join(POWER_UP_SCORE_ICONS.get(p, "") for p in snake.power_ups)
                 
                 score_text = f"Snake {snake.id} ({snake_type}): {snake.score}{power_ups}"
                 self.safe_addstr(y_pos, 1, score_text, snake_color)
@@ -3259,7 +3616,7 @@ class Renderer:
             max_per_line = min(8, (game_state.width - 4) // 10)
             alive_snakes = [s for s in game_state.snakes if s.alive]
             
-            for i, snake in enumerate(sorted(alive_snakes, key=lambda s: s.score, reverse=True)):
+            for i, snake in enumerate(sorted(alive_snakes, key=attrgetter("score"), reverse=True)):
                 row = i // max_per_line
                 col = i % max_per_line
                 
@@ -3271,11 +3628,7 @@ class Renderer:
                 
                 # Add power-up indicators
                 if snake.power_ups:
-                    for p in snake.power_ups:
-                        if p == PowerUpType.INVINCIBILITY:
-                            score_text += "*"
-                        elif p == PowerUpType.GHOST:
-                            score_text += "g"
+                    score_text += "".join(POWER_UP_COMPACT_MARKS.get(p, "") for p in snake.power_ups)
                 
                 self.safe_addstr(y_pos, x_pos, score_text, snake_color)
     
@@ -3293,30 +3646,16 @@ class Renderer:
         ]
         
         # Draw title and subtitle
-        title_color = curses.color_pair(4) | curses.A_BOLD
-        subtitle_color = curses.color_pair(6)
+        title_color = self._color_pairs[4] | curses.A_BOLD
+        subtitle_color = self._color_pairs[6]
         
         self.safe_addstr(height//4, (width - len(title))//2, title, title_color)
         self.safe_addstr(height//4 + 1, (width - len(subtitle))//2, subtitle, subtitle_color)
         self.safe_addstr(height//4 + 2, (width - len(author))//2, author)
         
         # Draw snake decoration
-        snake_art = [
-            "    _________         _________",
-            "   /         \\       /         \\",
-            "  /  /~~~~~~~\\\\     /  /~~~~~~~\\\\",
-            " /  /        _\\\\   /  /        _\\\\",
-            "|  |        /  || |  |        /  ||",
-            "|  |       |   || |  |       |   ||",
-            "|  |       |   || |  |       |   ||",
-            " \\  \\      |  //   \\  \\      |  //",
-            "  \\  ~~~~~  //     \\  ~~~~~  //",
-            "   \\_______//       \\_______//",
-        ]
-        
-        for i, line in enumerate(snake_art):
-            color = curses.color_pair(i % 5 + 1)
-            self.safe_addstr(height//4 + 4 + i, (width - len(line))//2, line, color)
+        for y, (line, color) in enumerate(self._snake_art, height//4 + 4):
+            self.safe_addstr(y, (width - len(line))//2, line, color)
         
         return options
     
@@ -3345,7 +3684,7 @@ class Renderer:
         self.stdscr.clear()
         
         # Draw header
-        self.safe_addstr(2, width//2 - 4, "GAME OVER", curses.A_BOLD | curses.color_pair(3))
+        self.safe_addstr(2, width//2 - 4, "GAME OVER", curses.A_BOLD | self._color_pairs[3])
         self.safe_addstr(3, width//2 - 3, "RANKING", curses.A_BOLD)
         
         # Calculate game duration
@@ -3431,17 +3770,17 @@ class Renderer:
             color = self.get_snake_color(winner.id)
         elif len(alive_snakes) > 1:
             # Multiple survivors, highest score wins
-            winner = max(alive_snakes, key=lambda s: s.score)
+            winner = max(alive_snakes, key=attrgetter("score"))
             result = f"Snake {winner.id} wins with highest score!"
             color = self.get_snake_color(winner.id)
         else:
             # No survivors, highest score from all snakes
-            winner = max(snakes, key=lambda s: s.score)
+            winner = max(snakes, key=attrgetter("score"))
             result = f"All snakes died! Snake {winner.id} had the highest score."
             color = self.get_snake_color(winner.id)
         
         # Draw result
-        self.safe_addstr(height//3, (width - len("GAME OVER"))//2, "GAME OVER", curses.A_BOLD | curses.color_pair(3))
+        self.safe_addstr(height//3, (width - len("GAME OVER"))//2, "GAME OVER", curses.A_BOLD | self._color_pairs[3])
         self.safe_addstr(height//3 + 2, (width - len(result))//2, result, color | curses.A_BOLD)
         
         # Show winner's strategy if AI
@@ -3833,12 +4172,12 @@ class MenuSystem:
             color = self.renderer.get_snake_color(winner.id)
         elif len(alive_snakes) > 1:
             # Multiple survivors, highest score wins
-            winner = max(alive_snakes, key=lambda s: s.score)
+            winner = max(alive_snakes, key=attrgetter("score"))
             result = f"Snake {winner.id} wins with highest score!"
             color = self.renderer.get_snake_color(winner.id)
         else:
             # No survivors, highest score from all snakes
-            winner = max(game_state.snakes, key=lambda s: s.score)
+            winner = max(game_state.snakes, key=attrgetter("score"))
             result = f"All snakes died! Snake {winner.id} had the highest score."
             color = self.renderer.get_snake_color(winner.id)
         
@@ -4125,8 +4464,8 @@ class GameController:
                 if snake.is_confused() and new_dir:
                     # 50% chance to go random direction
                     if random.random() < 0.5:
-                        new_dir = random.choice([d for d in Direction.all_directions() 
-                                              if not Direction.is_opposite(d, snake.direction)])
+                        new_dir = random.choice([d for d in ALL_DIRECTIONS
+                                              if d is not OPPOSITE_DIRECTION[snake.direction]])
                 
                 if new_dir and not Direction.is_opposite(new_dir, snake.direction):
                     snake.direction = new_dir
@@ -4204,6 +4543,22 @@ class GameController:
 # MAIN FUNCTION
 # =============================================================================
 
+def profile_ai_decisions():
+    """Profile every AI decision from now on (--profile-ai) and return the profiler"""
+    import cProfile
+    profiler = cProfile.Profile()
+    choose_direction = Snake.choose_direction
+    
+    def profiled_choose_direction(*args, **kwargs):
+        profiler.enable()
+        try:
+            return choose_direction(*args, **kwargs)
+        finally:
+            profiler.disable()
+    
+    Snake.choose_direction = profiled_choose_direction
+    return profiler
+
 def main(stdscr):
     """Main function - entry point"""
     try:
@@ -4216,7 +4571,13 @@ def main(stdscr):
         stdscr.getch()
 
 if __name__ == '__main__':
+    # --profile-ai prints where the AI spends its time once the game exits
+    ai_profiler = profile_ai_decisions() if '--profile-ai' in sys.argv[1:] else None
     try:
         curses.wrapper(main)
     except KeyboardInterrupt:
         sys.exit(0)
+    finally:
+        if ai_profiler is not None:
+            import pstats
+            pstats.Stats(ai_profiler).sort_stats('tottime').print_stats(30)